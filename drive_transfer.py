@@ -15,15 +15,20 @@ import os
 import sys
 import json
 import time
+import hashlib
 import threading
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import partial
 from queue import Queue
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload, MediaUpload, build_http
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -31,6 +36,8 @@ from googleapiclient.errors import HttpError
 import pickle
 import io
 import ssl
+import mmap
+import tempfile
 import urllib3.exceptions
 
 # Configuration
@@ -38,6 +45,15 @@ SCOPES = ['https://www.googleapis.com/auth/drive']
 TOKEN_FILE = 'token.pickle'
 CREDENTIALS_FILE = 'credentials.json'
 CONFIG_FILE = 'transfer_config.json'
+SCAN_FIELDS = "nextPageToken, files(id, name, mimeType, size, md5Checksum, parents, shortcutDetails, driveId)"
+CHANGE_FIELDS = ("nextPageToken, newStartPageToken, changes(fileId, removed, "
+                 "file(id, name, mimeType, size, md5Checksum, parents, shortcutDetails, driveId, trashed))")
+BATCH_SIZE = 100  # Maximum calls per Drive batch request
+SHARE_GRANT_FILE = "share_grant.json"  # Temporary reader permission to revoke, kept in state_dir
+UPLOAD_SESSIONS_FILE = "upload_sessions.json"  # Open resumable upload sessions, kept in state_dir
+UPLOAD_SESSION_TTL = 6 * 24 * 3600  # Drive keeps resumable sessions for about a week
+CHUNK_ALIGNMENT = 256 * 1024  # Resumable upload chunks must be multiples of 256 KB
+MAX_QUERY_LENGTH = 6000  # Keep multi-parent list queries well inside Drive's URL length limit
 
 @dataclass
 class TransferConfig:
@@ -45,10 +61,10 @@ class TransferConfig:
     source_folder_id: str
     dest_folder_id: str
     max_workers: int = 4  # Reduced from 8 to prevent memory pressure
-    chunk_size: int = 8 * 1024 * 1024  # 8MB chunks
+    chunk_size: int = 8 * 1024 * 1024  # 8MB chunks (fixed size, or the streaming buffer unit when adaptive)
     max_retries: int = 3
     retry_delay: float = 1.0
-    rate_limit_delay: float = 0.1
+    rate_limit_delay: float = 0.1  # Legacy fixed delay, superseded by folder_requests_per_second
     progress_interval: int = 10
     network_timeout: int = 300  # 5 minutes timeout for network operations
     connection_timeout: int = 30  # 30 seconds timeout for individual connections
@@ -58,18 +74,395 @@ class TransferConfig:
     max_files: Optional[int] = None  # Limit number of files for debugging
     debug_mode: bool = False  # Enable debug output
     transfer_shortcuts: bool = True  # Enable transfer of Google Drive shortcuts
+    scan_workers: int = 8  # Parallel folder listings while scanning the source tree
+    scan_requests_per_second: float = 10.0  # Rate limit for listing requests during scans (0 = unlimited)
+    scan_mode: str = "folder"  # "folder" lists one folder per request, "batch" ORs many parents, "drive" lists the whole Shared Drive
+    scan_parents_per_query: int = 50  # Folders packed into one list request in batch scan mode
+    incremental_scan: bool = False  # Reuse the cached scan and apply Drive Changes API deltas
+    state_dir: str = ".transfer_state"  # Directory for scan caches and other resumable state
+    pipeline_mode: bool = False  # Overlap scanning, folder creation and file transfers
+    folder_requests_per_second: float = 10.0  # Rate limit for folder creation requests (0 = unlimited)
+    pregenerate_folder_ids: bool = False  # Assign destination folder IDs up front with files.generateIds
+    batch_requests: bool = False  # Group metadata-only calls (folders, shortcuts) into batch requests
+    dest_snapshot: bool = False  # List the destination tree once instead of checking each folder
+    lazy_folders: bool = False  # Create destination folders on demand instead of in a separate phase
+    streaming_transfers: bool = False  # Pipe downloads straight into resumable uploads instead of buffering whole files
+    stream_buffers: int = 4  # Chunks held in memory per streaming transfer (minimum 2)
+    spool_threshold: int = 64 * 1024 * 1024  # Buffered transfers larger than this spill to a temp file
+    spool_dir: Optional[str] = None  # Scratch directory for spilled transfers (None = system temp dir)
+    memory_budget: int = 1024 * 1024 * 1024  # Total RAM all workers may hold in transfer buffers
+    server_side_copy: bool = False  # Use files.copy when the destination account can read the source
+    share_then_copy: bool = False  # Temporarily share the source root with the destination account and copy server-side
+    parallel_download_threshold: int = 256 * 1024 * 1024  # Files at least this large are downloaded as parallel ranges
+    download_connections: int = 4  # Concurrent range requests per large file (1 = disabled)
+    adaptive_chunk_size: bool = True  # Tune chunk size per transfer from measured throughput and failures
+    min_chunk_size: int = 1024 * 1024  # Starting and smallest adaptive chunk
+    max_chunk_size: int = 64 * 1024 * 1024  # Largest adaptive chunk
+    small_file_threshold: int = 5 * 1024 * 1024  # Smaller files use a single multipart upload (Drive's multipart limit is 5MB)
+    small_file_workers: int = 32  # Workers on the separate small-file lane (0 = share the main workers)
+    verify_checksums: bool = True  # Compare an MD5 computed while transferring with the destination's md5Checksum
+    deduplicate_content: bool = True  # Upload each md5Checksum + size once, files.copy the upload for the rest
 
-@dataclass
 class FileInfo:
-    """Information about a file to be transferred."""
-    id: str
-    name: str
-    mime_type: str
-    size: int
-    parents: List[str]
-    path: str = ""
-    shortcut_target_id: Optional[str] = None
-    is_shortcut: bool = False
+    """Information about a file to be transferred.
+
+    Kept compact for multi-million item scans: slotted attributes, interned IDs and MIME types,
+    and a parent-pointer tree - records built with a ``parent`` derive ``path`` on demand
+    instead of storing a full path string each.
+    """
+    __slots__ = ('id', 'name', 'mime_type', 'size', 'parents', 'shortcut_target_id',
+                 'is_shortcut', 'parent', 'md5_checksum', '_path')
+
+    def __init__(self, id: str, name: str, mime_type: str, size: int, parents: List[str],
+                 path: str = "", shortcut_target_id: Optional[str] = None, is_shortcut: bool = False,
+                 parent: Optional['FileInfo'] = None, md5_checksum: Optional[str] = None):
+        self.id = sys.intern(id)
+        self.name = name
+        self.mime_type = sys.intern(mime_type)
+        self.size = size
+        self.parents = tuple(sys.intern(p) for p in parents)
+        self.shortcut_target_id = shortcut_target_id
+        self.is_shortcut = is_shortcut
+        self.parent = parent
+        self.md5_checksum = md5_checksum
+        self._path = None if parent is not None else path
+
+    @property
+    def path(self) -> str:
+        """Slash-separated path relative to the scanned root, built from the parent chain."""
+        if self._path is not None:
+            return self._path
+
+        parts = [self.name]
+        node = self.parent
+        while node._path is None:
+            parts.append(node.name)
+            node = node.parent
+        if node._path:
+            parts.append(node._path)
+        return '/'.join(reversed(parts))
+
+    @path.setter
+    def path(self, value: str):
+        self._path = value
+
+    def __repr__(self):
+        return (f"FileInfo(id={self.id!r}, name={self.name!r}, mime_type={self.mime_type!r}, "
+                f"size={self.size!r}, path={self.path!r})")
+
+class ChecksumMismatchError(Exception):
+    """An uploaded file's MD5 does not match the bytes that were downloaded for it."""
+
+class FolderCreationError(Exception):
+    """An item's destination folder could not be created; with lazy folders, transfers into it are retried."""
+
+class RateLimiter:
+    """Thread-safe token bucket that limits how many API requests start per second."""
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None):
+        self.rate = requests_per_second
+        self.capacity = burst or max(1, int(requests_per_second))
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, requests: int = 1):
+        """Block until the given number of requests may be issued."""
+        if self.rate <= 0:
+            return
+
+        for _ in range(requests - 1):
+            self.acquire()
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+class ChunkPipe:
+    """Bounded, thread-safe byte pipe from a chunked download to a chunked resumable upload.
+
+    The download side blocks once ``max_buffered`` bytes are held. The upload side reads by
+    absolute offset and may re-read anything from its last requested offset onwards, which is
+    what a resumable upload needs when the server commits only part of a chunk.
+    """
+
+    def __init__(self, max_buffered: int):
+        self.max_buffered = max_buffered
+        self.chunks = deque()  # Downloaded chunks in stream order
+        self.start = 0  # Stream offset of chunks[0]
+        self.end = 0  # Stream offset just past the last buffered byte
+        self.finished = False  # Download side is done (successfully or with error)
+        self.aborted = False  # Upload side gave up
+        self.error: Optional[BaseException] = None
+        self.condition = threading.Condition()
+
+    def write(self, data) -> int:
+        """Append downloaded bytes, waiting while the buffer is full (called by MediaIoBaseDownload)."""
+        with self.condition:
+            while self.end - self.start >= self.max_buffered and not self.aborted:
+                self.condition.wait()
+            if self.aborted:
+                raise IOError("Upload side of the stream was aborted")
+            if data:
+                self.chunks.append(bytes(data))
+                self.end += len(data)
+                self.condition.notify_all()
+        return len(data)
+
+    def finish(self, error: Optional[BaseException] = None):
+        """Mark the download as complete, or failed with error."""
+        with self.condition:
+            self.finished = True
+            self.error = error
+            self.condition.notify_all()
+
+    def skip_to(self, offset: int):
+        """Start the stream at offset, for uploads resuming past bytes the server already has."""
+        with self.condition:
+            self.start = self.end = offset
+
+    def abort(self):
+        """Release a download blocked on a full buffer after the upload side failed."""
+        with self.condition:
+            self.aborted = True
+            self.chunks.clear()
+            self.condition.notify_all()
+
+    def read_at(self, begin: int, length: int) -> bytes:
+        """Return up to length bytes starting at begin, releasing everything before begin."""
+        with self.condition:
+            while self.chunks and self.start + len(self.chunks[0]) <= begin:
+                self.start += len(self.chunks.popleft())
+                self.condition.notify_all()
+
+            while self.end < begin + length and not self.finished:
+                self.condition.wait()
+            if self.error is not None:
+                raise self.error
+            if begin < self.start:
+                raise IOError(f"Stream offset {begin} was already released")
+
+            stop = min(begin + length, self.end)
+            parts = []  # memoryviews, so a range inside a single chunk is returned without copying
+            offset = self.start
+            for chunk in self.chunks:
+                chunk_end = offset + len(chunk)
+                if chunk_end > begin and offset < stop:
+                    parts.append(memoryview(chunk)[max(begin - offset, 0):stop - offset])
+                if chunk_end >= stop:
+                    break
+                offset = chunk_end
+            return parts[0] if len(parts) == 1 else b''.join(parts)
+
+class MemoryBudget:
+    """Process-wide cap on bytes held in memory by transfer buffers; workers wait instead of exceeding it."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.condition = threading.Condition()
+        self.reclaim = None  # Called under condition to free idle reservations; True if it freed any
+
+    def acquire(self, amount: int) -> int:
+        """Reserve amount bytes, blocking until they fit. Returns the amount actually reserved."""
+        amount = min(amount, self.limit)  # A single oversized request waits for an empty budget
+        with self.condition:
+            while self.used + amount > self.limit:
+                if self.reclaim is None or not self.reclaim():
+                    self.condition.wait()
+            self.used += amount
+        return amount
+
+    def try_acquire(self, amount: int) -> bool:
+        """Reserve amount bytes if they fit right now."""
+        amount = min(amount, self.limit)
+        with self.condition:
+            if self.used + amount > self.limit:
+                return False
+            self.used += amount
+            return True
+
+    def release(self, amount: int):
+        with self.condition:
+            self.used -= amount
+            self.condition.notify_all()
+
+class BufferPool:
+    """Reusable bytearray transfer buffers in power-of-two size classes.
+
+    Buffers return to the pool after each transfer instead of being freed, so steady-state transfers
+    allocate nothing and leave nothing for the garbage collector. Pooled bytes count against the
+    MemoryBudget; idle buffers are dropped when any budget user needs their bytes.
+    """
+
+    def __init__(self, budget: MemoryBudget, min_size: int = CHUNK_ALIGNMENT):
+        self.budget = budget
+        self.min_size = min_size
+        self.free: Dict[int, List[bytearray]] = defaultdict(list)  # size class -> idle buffers
+        budget.reclaim = self._drop_idle_buffer  # Other budget users can claim idle buffers' bytes too
+
+    def size_class(self, size: int) -> int:
+        size_class = self.min_size
+        while size_class < size:
+            size_class *= 2
+        return size_class
+
+    def acquire(self, size: int) -> bytearray:
+        """Get a buffer of at least size bytes, waiting for budget if none is idle."""
+        size_class = self.size_class(size)
+        with self.budget.condition:  # Re-entrant; also woken by every budget release
+            while True:
+                if self.free[size_class]:
+                    return self.free[size_class].pop()
+                if self.budget.try_acquire(size_class):
+                    break
+                if not self._drop_idle_buffer():
+                    self.budget.condition.wait()
+        return bytearray(size_class)
+
+    def release(self, buffer: bytearray):
+        with self.budget.condition:
+            self.free[len(buffer)].append(buffer)
+            self.budget.condition.notify_all()
+
+    def _drop_idle_buffer(self) -> bool:
+        for idle in self.free.values():
+            if idle:
+                self.budget.release(min(len(idle.pop()), self.budget.limit))
+                return True
+        return False
+
+class SpoolFile(tempfile.SpooledTemporaryFile):
+    """Transfer buffer kept in RAM up to max_size and in a temp file beyond it.
+
+    Holds a MemoryBudget reservation while the data is in memory; it is returned as soon as the
+    buffer rolls over to disk or is closed.
+    """
+
+    def __init__(self, budget: MemoryBudget, reserved: int, max_size: int, dir: Optional[str] = None):
+        super().__init__(max_size=max_size, dir=dir)
+        self._budget = budget
+        self._reserved = reserved
+
+    def _release(self):
+        if self._reserved:
+            self._budget.release(self._reserved)
+            self._reserved = 0
+
+    def rollover(self):
+        super().rollover()
+        self._release()
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._release()
+
+class ChunkSizer:
+    """Chunk size for one transfer direction, tuned from measured chunk throughput and failures.
+
+    Starts at the minimum for fast first progress and doubles while throughput keeps improving.
+    A failed chunk halves the size, and each failure makes it wait longer before growing again.
+    Sizes stay multiples of CHUNK_ALIGNMENT.
+    """
+
+    def __init__(self, minimum: int, maximum: int):
+        self.minimum = max(CHUNK_ALIGNMENT, minimum // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+        self.maximum = max(self.minimum, maximum // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+        self.chunk_size = self.minimum
+        self.best_throughput = 0.0
+        self.failures = 0
+        self.successes = 0  # Chunks since the last failure
+
+    def record(self, nbytes: int, seconds: float):
+        """Account for a completed chunk of nbytes that took seconds."""
+        self.successes += 1
+        if nbytes < self.chunk_size or self.successes < 2 ** min(self.failures, 6):
+            return  # Final short chunk, or still cooling down after a failure
+        throughput = nbytes / max(seconds, 1e-6)
+        improving = throughput > self.best_throughput * 1.1
+        self.best_throughput = max(self.best_throughput, throughput)
+        if improving:
+            self.chunk_size = min(self.chunk_size * 2, self.maximum)
+
+    def record_failure(self):
+        """Shrink after a failed chunk so less work is lost the next time."""
+        self.failures += 1
+        self.successes = 0
+        self.best_throughput = 0.0
+        self.chunk_size = max(self.chunk_size // 2 // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT, self.minimum)
+
+class StreamingMediaUpload(MediaUpload):
+    """Resumable MediaUpload whose bytes come from a ChunkPipe filled by a concurrent download."""
+
+    def __init__(self, pipe: ChunkPipe, mimetype: str, sizer: ChunkSizer, size: Optional[int] = None):
+        super().__init__()
+        self._pipe = pipe
+        self._mimetype = mimetype
+        self._sizer = sizer
+        self._size = size
+
+    def chunksize(self):
+        return self._sizer.chunk_size
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return self._size  # None (unknown) for exports; the upload ends on the first short read
+
+    def resumable(self):
+        return True
+
+    def getbytes(self, begin, length):
+        return self._pipe.read_at(begin, length)
+
+    def has_stream(self):
+        return False
+
+class BufferMediaUpload(MediaUpload):
+    """MediaUpload that hands out zero-copy memoryview slices of a transfer buffer.
+
+    Non-resumable uploads send the whole buffer in one multipart body, which must be built from bytes.
+    """
+
+    def __init__(self, buffer, mimetype: str, sizer: ChunkSizer, resumable: bool = True):
+        super().__init__()
+        self._view = memoryview(buffer)
+        self._mimetype = mimetype
+        self._sizer = sizer
+        self._resumable = resumable
+
+    def chunksize(self):
+        return self._sizer.chunk_size
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return len(self._view)
+
+    def resumable(self):
+        return self._resumable
+
+    def getbytes(self, begin, length):
+        if not self._resumable:
+            return bytes(self._view[begin:begin + length])
+        return self._view[begin:begin + length]
+
+    def has_stream(self):
+        return False
+
+    def release(self):
+        self._view.release()
 
 class GoogleDriveTransfer:
     """Main class for handling Google Drive transfers."""
@@ -88,6 +481,25 @@ class GoogleDriveTransfer:
         self.error_count = 0  # Track errors for adaptive concurrency
         self.current_workers = self.config.max_workers  # Adaptive worker count
         self.ssl_context = self._create_ssl_context()  # Robust SSL context
+        self.scan_rate_limiter = RateLimiter(self.config.scan_requests_per_second)
+        self.scan_api_calls = 0
+        self.folder_rate_limiter = RateLimiter(self.config.folder_requests_per_second)
+        self.dest_snapshot_future: Optional[Future] = None  # Pending/complete destination folder index
+        self.source_folders: Dict[str, FileInfo] = {}  # Source folders eligible for on-demand creation
+        self.folder_futures: Dict[str, Future] = {}  # source_id -> future of its on-demand creation
+        self.folder_futures_lock = threading.Lock()
+        self.failed_folders = set()  # Source folders whose pre-assigned destination folder could not be created
+        self.memory_budget = MemoryBudget(self.config.memory_budget)
+        self.buffer_pool = BufferPool(self.memory_budget)
+        self.copy_access: Dict[str, bool] = {}  # source folder_id -> readable by the destination account
+        self.copy_access_lock = threading.Lock()
+        self.credentials = {}  # account_type -> credentials, for extra connections
+        self.thread_connections = threading.local()  # Per-thread AuthorizedHttp for each account
+        self.upload_sessions: Dict[str, dict] = (self._read_state_file(UPLOAD_SESSIONS_FILE) or {}
+                                                 if self.config.enable_resumable else {})
+        self.upload_sessions_lock = threading.Lock()
+        self.path_counts: Dict[str, int] = defaultdict(int)  # Transfer path -> files completed through it
+        self.content_dest_ids: Dict[Tuple[str, int], str] = {}  # (md5Checksum, size) -> destination file with it
 
     def _create_ssl_context(self):
         """Create a robust SSL context to prevent SSL handshake failures."""
@@ -275,6 +687,8 @@ class GoogleDriveTransfer:
             with open(token_file, 'wb') as token:
                 pickle.dump(creds, token)
 
+        self.credentials[account_type] = creds
+
         # Build service with modern config for reliability (latest client best practice)
         try:
             return build('drive', 'v3', credentials=creds, cache_discovery=False)
@@ -283,7 +697,7 @@ class GoogleDriveTransfer:
             raise
 
     def get_folder_structure(self, folder_id: str, service, base_path: str = "") -> Dict[str, FileInfo]:
-        """Efficiently get all files and folders in the specified folder using batch processing."""
+        """Get all files and folders below the specified folder, crawling subfolders in parallel."""
         print(f"📁 Scanning folder: {base_path or 'Root'}")
         print("   🔄 Getting complete file list... (this may take a moment)")
 
@@ -295,74 +709,369 @@ class GoogleDriveTransfer:
         if not folder_id or folder_id == 'None' or folder_id.strip() == '':
             raise Exception(f"Invalid folder ID: '{folder_id}' - folder ID cannot be empty")
 
-        # First, get all files and folders in a single query
-        all_files = self._get_all_files_in_folder(folder_id, service)
+        if self.config.incremental_scan:
+            return self._get_folder_structure_incremental(folder_id, service, base_path)
+
+        all_files = self._scan_items(folder_id, service)
+        structure = self._build_structure(folder_id, all_files, base_path)
+
+        print(f"   ✅ Structure built: {len(structure)} total items")
+        return structure
+
+    def _scan_items(self, folder_id: str, service, failed_folders: Optional[List[str]] = None) -> List[dict]:
+        """Return the flat list of Drive items below folder_id using the configured scan mode.
+
+        Folders that could not be listed are appended to failed_folders when it is given.
+        """
+        all_files = None
+        if self.config.scan_mode == 'drive':
+            all_files = self._list_shared_drive(folder_id, service)
+
+        if all_files is None:
+            # Crawl the whole tree, listing every discovered subfolder concurrently
+            all_files = []
+            for _, items in self._crawl_folder_tree(folder_id, service, failed_folders=failed_folders):
+                all_files.extend(items)
+
+        return all_files
+
+    def _get_folder_structure_incremental(self, folder_id: str, service, base_path: str = "") -> Dict[str, FileInfo]:
+        """Rebuild the structure from the cached scan plus the Drive Changes API deltas since it was taken."""
+        cache_name = f"scan_{folder_id}.json"
+        cache = self._read_state_file(cache_name)
+        items_by_id = None
+        failed_folders = []
+
+        if cache and cache.get('folder_id') == folder_id:
+            drive_id = cache.get('drive_id')
+            items_by_id = {item['id']: item for item in cache['items']}
+            print(f"   ♻️  Loaded cached scan with {len(items_by_id)} items, applying changes since last run...")
+            try:
+                page_token = self._apply_drive_changes(cache['page_token'], drive_id, items_by_id, service,
+                                                       failed_folders)
+            except HttpError as e:
+                print(f"   ⚠️  Could not read changes ({e.resp.status}) - falling back to a full scan")
+                items_by_id = None
+
+        if items_by_id is None:
+            drive_id = self._get_drive_id(folder_id, service)
+            # Take the token before scanning so changes made during the scan are replayed next time
+            page_token = self._get_start_page_token(drive_id, service)
+            items_by_id = {item['id']: item for item in self._scan_items(folder_id, service, failed_folders)}
+
+        structure = self._build_structure(folder_id, list(items_by_id.values()), base_path)
+
+        # Later runs only apply deltas to the cache, so an incomplete scan must never be saved as one
+        if failed_folders:
+            print(f"   ⚠️  Structure built: {len(structure)} total items - scan incomplete, not cached")
+            return structure
+
+        # Only keep items that are still inside the tree
+        self._write_state_file(cache_name, {
+            'folder_id': folder_id,
+            'drive_id': drive_id,
+            'page_token': page_token,
+            'items': [items_by_id[fid] for fid in structure],
+        })
+
+        print(f"   ✅ Structure built: {len(structure)} total items (scan cached for incremental runs)")
+        return structure
+
+    def _get_drive_id(self, folder_id: str, service) -> Optional[str]:
+        """Return the Shared Drive ID that contains folder_id, or None for My Drive."""
+        folder = service.files().get(
+            fileId=folder_id, fields='id, driveId', supportsAllDrives=True
+        ).execute()
+        return (folder or {}).get('driveId')
+
+    def _get_start_page_token(self, drive_id: Optional[str], service) -> str:
+        """Get the Changes API token marking the current state of the drive."""
+        drive_kwargs = {'driveId': drive_id} if drive_id else {}
+        response = service.changes().getStartPageToken(supportsAllDrives=True, **drive_kwargs).execute()
+        return response['startPageToken']
+
+    def _apply_drive_changes(self, page_token: str, drive_id: Optional[str], items_by_id: Dict[str, dict],
+                             service, failed_folders: Optional[List[str]] = None) -> str:
+        """Apply adds, moves, renames and trashes since page_token to items_by_id; return the new token.
+
+        Moved-in folders that could not be crawled are appended to failed_folders when it is given.
+        """
+        drive_kwargs = {'driveId': drive_id} if drive_id else {}
+        new_folders = []
+        change_count = 0
+
+        while True:
+            self.scan_rate_limiter.acquire()
+            response = service.changes().list(
+                pageToken=page_token,
+                fields=CHANGE_FIELDS,
+                pageSize=1000,
+                includeRemoved=True,
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True,
+                **drive_kwargs
+            ).execute()
+
+            for change in response.get('changes', []):
+                file_id = change.get('fileId')
+                if not file_id:
+                    continue  # Shared Drive level change
+                change_count += 1
+
+                changed_file = change.get('file')
+                if change.get('removed') or not changed_file or changed_file.get('trashed'):
+                    items_by_id.pop(file_id, None)
+                    continue
+
+                changed_file.pop('trashed', None)
+                if (changed_file.get('mimeType') == 'application/vnd.google-apps.folder'
+                        and file_id not in items_by_id):
+                    new_folders.append(file_id)
+                items_by_id[file_id] = changed_file
+
+            if 'newStartPageToken' in response:
+                page_token = response['newStartPageToken']
+                break
+            page_token = response['nextPageToken']
+
+        # Folders moved in from elsewhere bring unchanged children the cache has never seen
+        new_folder_ids = set(new_folders)
+        for new_folder_id in new_folders:
+            if any(p in new_folder_ids for p in items_by_id[new_folder_id].get('parents', [])):
+                continue  # Covered by crawling its new ancestor
+            for _, children in self._crawl_folder_tree(new_folder_id, service, failed_folders=failed_folders):
+                for child in children:
+                    items_by_id[child['id']] = child
+
+        print(f"   🔁 Applied {change_count} changes ({len(new_folders)} new folders crawled)")
+        return page_token
+
+    def _read_state_file(self, name: str) -> Optional[dict]:
+        """Load a JSON state file from the state directory, or None if it does not exist."""
+        state_file = Path(self.config.state_dir) / name
+        if not state_file.exists():
+            return None
+        try:
+            with open(state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable state file {state_file}: {e}")
+            return None
+
+    def _write_state_file(self, name: str, data: dict):
+        """Atomically write a JSON state file to the state directory."""
+        state_dir = Path(self.config.state_dir)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = state_dir / f"{name}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, state_dir / name)
+
+    def _build_structure(self, folder_id: str, all_files: List[dict], base_path: str = "") -> Dict[str, FileInfo]:
+        """Build the folder tree below folder_id from a flat list of Drive items in linear time."""
+        # Index every item under each of its parents in a single pass
+        children: Dict[str, List[dict]] = defaultdict(list)
+        for item in all_files:
+            for parent_id in item.get('parents', []):
+                children[parent_id].append(item)
 
-        # Build the folder tree structure
         structure = {}
-        folders_to_process = [folder_id]
-        folder_paths = {folder_id: base_path}
-        total_folders = len([f for f in all_files if f.get('mimeType') == 'application/vnd.google-apps.folder'])
+        folders_to_process = deque([folder_id])
+        total_folders = sum(1 for f in all_files if f.get('mimeType') == 'application/vnd.google-apps.folder')
         processed_folders = 0
 
         print(f"   🏗️  Building structure for {total_folders} folders...")
 
         while folders_to_process:
-            current_folder_id = folders_to_process.pop(0)
-            current_path = folder_paths[current_folder_id]
+            current_folder_id = folders_to_process.popleft()
+            current_folder = structure.get(current_folder_id)  # None for the scanned root
             processed_folders += 1
 
-            if processed_folders % 10 == 0 or processed_folders == total_folders:
+            if processed_folders % 1000 == 0 or processed_folders == total_folders:
                 print(f"   📊 Progress: {processed_folders}/{total_folders} folders processed")
 
-            # Get all items in current folder
-            folder_items = [item for item in all_files
-                          if current_folder_id in item.get('parents', [])]
-
-            for item in folder_items:
-                file_path = f"{current_path}/{item['name']}" if current_path else item['name']
-                shortcut_details = item.get('shortcutDetails', {}) or {}
-                is_shortcut = item.get('mimeType') == 'application/vnd.google-apps.shortcut'
-                file_info = FileInfo(
-                    id=item['id'],
-                    name=item['name'],
-                    mime_type=item.get('mimeType', ''),
-                    size=int(item.get('size', 0)),
-                    parents=item.get('parents', []),
-                    path=file_path,
-                    shortcut_target_id=shortcut_details.get('targetId') if is_shortcut else None,
-                    is_shortcut=is_shortcut
-                )
-                structure[item['id']] = file_info
+            for item in children.get(current_folder_id, ()):
+                if item['id'] in structure:
+                    continue
+
+                structure[item['id']] = self._make_file_info(item, current_folder, base_path)
 
                 # If it's a folder, add to processing queue
                 if item.get('mimeType') == 'application/vnd.google-apps.folder':
                     folders_to_process.append(item['id'])
-                    folder_paths[item['id']] = file_path
 
-        print(f"   ✅ Structure built: {len(structure)} total items")
         return structure
 
-    def _get_all_files_in_folder(self, folder_id: str, service) -> List[dict]:
-        """Get all files and folders in a folder using efficient pagination."""
+    def _make_file_info(self, item: dict, parent: Optional[FileInfo], base_path: str = "") -> FileInfo:
+        """Convert a Drive API file resource into a FileInfo linked to its parent folder's record.
+
+        Items directly below the scanned root have no parent record and store their path explicitly.
+        """
+        file_path = ""
+        if parent is None:
+            file_path = f"{base_path}/{item['name']}" if base_path else item['name']
+
+        shortcut_details = item.get('shortcutDetails', {}) or {}
+        is_shortcut = item.get('mimeType') == 'application/vnd.google-apps.shortcut'
+        return FileInfo(
+            id=item['id'],
+            name=item['name'],
+            mime_type=item.get('mimeType', ''),
+            size=int(item.get('size', 0)),
+            parents=item.get('parents', []),
+            path=file_path,
+            shortcut_target_id=shortcut_details.get('targetId') if is_shortcut else None,
+            is_shortcut=is_shortcut,
+            parent=parent,
+            md5_checksum=item.get('md5Checksum')
+        )
+
+    def _crawl_folder_tree(self, folder_id: str, service, folders_only: bool = False,
+                           parents_per_query: Optional[int] = None, failed_folders: Optional[List[str]] = None):
+        """Yield (folder_id, items) for every folder in the tree as its listing completes.
+
+        Subfolders are listed concurrently on a bounded pool of ``scan_workers`` threads as soon
+        as they are discovered; listing requests are throttled by ``scan_rate_limiter``. In
+        ``batch`` scan mode each request lists up to ``scan_parents_per_query`` folders at once.
+        With folders_only, files are left out of the listings; parents_per_query overrides the scan mode.
+        Folders whose listing failed are appended to failed_folders, so callers can tell the scan is incomplete.
+        """
+        start_time = time.time()
+        listed_folders = 0
+        listed_items = 0
+        if failed_folders is None:
+            failed_folders = []
+        queued_folders = deque([folder_id])
+        if parents_per_query is None:
+            parents_per_query = self.config.scan_parents_per_query if self.config.scan_mode == 'batch' else 1
+
+        with ThreadPoolExecutor(max_workers=self.config.scan_workers) as executor:
+            pending = {}
+
+            def submit_listings():
+                # Hold back partial batches while the pool is busy so queries stay well packed
+                while queued_folders and (len(queued_folders) >= parents_per_query
+                                          or len(pending) < self.config.scan_workers):
+                    batch = self._next_parent_batch(queued_folders, parents_per_query)
+                    pending[executor.submit(self._list_children_batch, batch, service, folders_only)] = batch
+
+            submit_listings()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    batch = pending.pop(future)
+                    try:
+                        children_by_parent = future.result()
+                    except Exception as e:
+                        print(f"❌ Could not list {len(batch)} folder(s) starting with {batch[0]}: {e}")
+                        failed_folders.extend(batch)
+                        continue
+
+                    for parent_id in batch:
+                        items = children_by_parent.get(parent_id, [])
+
+                        # Queue subfolders before handing the listing to the caller
+                        for item in items:
+                            if item.get('mimeType') == 'application/vnd.google-apps.folder':
+                                queued_folders.append(item['id'])
+
+                        listed_folders += 1
+                        listed_items += len(items)
+                        yield parent_id, items
+
+                    submit_listings()
+                    if listed_folders % 100 < len(batch) or not pending:
+                        elapsed = max(time.time() - start_time, 1e-6)
+                        print(f"   📊 Scanned {listed_folders} folders, {listed_items} items "
+                              f"({listed_folders / elapsed:.1f} folders/sec, {len(pending)} requests in flight)")
+
+        elapsed = time.time() - start_time
+        print(f"   ✅ Retrieved {listed_items} total items from {listed_folders} folders in {elapsed:.1f}s "
+              f"({self.scan_api_calls} list requests)")
+        if failed_folders:
+            print(f"⚠️  {len(failed_folders)} folders could not be listed - the scan is incomplete")
+
+    def _list_shared_drive(self, folder_id: str, service) -> Optional[List[dict]]:
+        """Page through the whole Shared Drive containing folder_id in one flat listing.
+
+        Returns None when the folder is not on a Shared Drive so the caller can fall back to crawling.
+        """
+        drive_id = self._get_drive_id(folder_id, service)
+
+        if not drive_id:
+            print("   ⚠️  Folder is not on a Shared Drive - falling back to folder-by-folder scan")
+            return None
+
+        print(f"   🗄️  Listing entire Shared Drive {drive_id} with corpora=drive")
+        start_time = time.time()
+        all_files = self._list_files("trashed = false", service, corpora='drive', driveId=drive_id)
+        print(f"   ⏱️  Shared Drive listed in {time.time() - start_time:.1f}s "
+              f"({self.scan_api_calls} list requests)")
+        return all_files
+
+    def _next_parent_batch(self, queued_folders: deque, max_parents: int) -> List[str]:
+        """Take the next folder IDs to list together, keeping the OR query under MAX_QUERY_LENGTH."""
+        batch = [queued_folders.popleft()]
+        query_length = len(f"('{batch[0]}' in parents) and trashed = false")
+
+        while queued_folders and len(batch) < max_parents:
+            clause_length = len(f" or '{queued_folders[0]}' in parents")
+            if query_length + clause_length > MAX_QUERY_LENGTH:
+                break
+            batch.append(queued_folders.popleft())
+            query_length += clause_length
+
+        return batch
+
+    def _list_children_batch(self, folder_ids: List[str], service, folders_only: bool = False) -> Dict[str, List[dict]]:
+        """List the direct children of several folders with one OR query, grouped by parent."""
+        type_filter = " and mimeType = 'application/vnd.google-apps.folder'" if folders_only else ""
+        if len(folder_ids) == 1:
+            query = f"'{folder_ids[0]}' in parents and trashed = false{type_filter}"
+            return {folder_ids[0]: self._list_files(query, service, verbose=False)}
+
+        parent_clauses = ' or '.join(f"'{fid}' in parents" for fid in folder_ids)
+        items = self._list_files(f"({parent_clauses}) and trashed = false{type_filter}", service, verbose=False)
+
+        wanted = set(folder_ids)
+        children_by_parent: Dict[str, List[dict]] = defaultdict(list)
+        for item in items:
+            for parent_id in item.get('parents', []):
+                if parent_id in wanted:
+                    children_by_parent[parent_id].append(item)
+        return children_by_parent
+
+    def _get_all_files_in_folder(self, folder_id: str, service, verbose: bool = True) -> List[dict]:
+        """Get the direct children of a folder using efficient pagination."""
+        return self._list_files(f"'{folder_id}' in parents and trashed = false", service, verbose)
+
+    def _list_files(self, query: str, service, verbose: bool = True, **list_kwargs) -> List[dict]:
+        """Page through every file matching a Drive query."""
         all_files = []
         page_token = None
         page_count = 0
+        http = self._thread_http(service)  # Scan workers list concurrently
 
         while True:
             try:
                 page_count += 1
-                if page_count % 10 == 0:
+                if verbose and page_count % 10 == 0:
                     print(f"   📄 Retrieved {len(all_files)} items so far...")
 
+                self.scan_rate_limiter.acquire()
+                with self.progress_lock:
+                    self.scan_api_calls += 1
                 results = service.files().list(
-                    q=f"'{folder_id}' in parents and trashed = false",
-                    fields="nextPageToken, files(id, name, mimeType, size, parents, shortcutDetails, driveId)",
+                    q=query,
+                    fields=SCAN_FIELDS,
                     pageToken=page_token,
                     pageSize=1000,
                     supportsAllDrives=True,
-                    includeItemsFromAllDrives=True
-                ).execute()
+                    includeItemsFromAllDrives=True,
+                    **list_kwargs
+                ).execute(http=http)
 
                 if results is None:
                     raise Exception("Google API returned None response")
@@ -374,10 +1083,6 @@ class GoogleDriveTransfer:
                 if not page_token:
                     break
 
-                # Only add small delay to respect rate limits
-                if page_count > 1:
-                    time.sleep(0.1)
-
             except HttpError as e:
                 if e.resp.status in [403, 429, 500, 502, 503, 504]:
                     wait_time = min(self.config.retry_delay * (2 ** page_count), 60)
@@ -386,79 +1091,372 @@ class GoogleDriveTransfer:
                 else:
                     raise
 
-        print(f"   ✅ Retrieved {len(all_files)} total items")
+        if verbose:
+            print(f"   ✅ Retrieved {len(all_files)} total items")
         return all_files
 
     def create_folder_structure(self, files: Dict[str, FileInfo]) -> None:
-        """Create the folder structure in destination drive."""
+        """Create the folder structure in destination drive, one depth level at a time.
+
+        Every folder at the same depth is created concurrently on the worker pool; the next level
+        starts once the previous one is done. Requests are paced by ``folder_rate_limiter``.
+        """
         print("🏗️  Creating folder structure...")
 
         # Get all folders (files with folder mime type)
         folders = {fid: f for fid, f in files.items()
                   if f.mime_type == 'application/vnd.google-apps.folder'}
 
-        # Sort folders by depth to ensure parents are created first
-        sorted_folders = sorted(folders.values(),
-                              key=lambda x: x.path.count('/'))
+        if self.config.pregenerate_folder_ids:
+            self._create_folders_with_generated_ids(folders)
+            return
 
-        for folder in sorted_folders:
-            # Check if folder already exists in mapping
-            if folder.id in self.folder_mapping:
-                continue
+        # Group folders by depth so parents always exist before their children
+        levels: Dict[int, List[FileInfo]] = defaultdict(list)
+        for folder in folders.values():
+            if folder.id not in self.folder_mapping:
+                levels[folder.path.count('/')].append(folder)
 
-            # Find parent folder in destination
-            parent_path = '/'.join(folder.path.split('/')[:-1])
-            parent_id = self.config.dest_folder_id
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            for depth in sorted(levels):
+                level_start = time.time()
 
-            if parent_path:
-                # Find parent folder ID in our mapping
-                parent_folder = next(
-                    (f for f in folders.values() if f.path == parent_path), None
-                )
-                if parent_folder and parent_folder.id in self.folder_mapping:
-                    parent_id = self.folder_mapping[parent_folder.id]
-
-            # Check if folder already exists in destination
-            existing_folder_id = self._check_folder_exists(folder.name, parent_id)
-            if existing_folder_id:
-                print(f"📁 Folder already exists: {folder.path} (ID: {existing_folder_id})")
-                self.folder_mapping[folder.id] = existing_folder_id
+                if self.config.batch_requests:
+                    created = self._create_folders_batched(levels[depth], folders)
+                else:
+                    futures = [
+                        executor.submit(self._create_dest_folder, folder, self._find_dest_parent_id(folder))
+                        for folder in levels[depth]
+                    ]
+                    # Barrier: the next depth needs every folder of this one in folder_mapping
+                    wait(futures)
+                    created = sum(1 for f in futures if f.exception() is None and f.result())
+
+                print(f"   📂 Depth {depth}: {created}/{len(levels[depth])} folders ready "
+                      f"in {time.time() - level_start:.1f}s")
+
+        total = sum(len(level) for level in levels.values())
+        elapsed = max(time.time() - start_time, 1e-6)
+        print(f"   ✅ {total} folders processed in {elapsed:.1f}s ({total / elapsed:.1f} folders/sec)")
+
+    def _create_folders_batched(self, level: List[FileInfo], folders: Dict[str, FileInfo]) -> int:
+        """Check and create one depth level of folders through batch requests; return how many are ready."""
+        parent_ids = {folder.id: self._find_dest_parent_id(folder) for folder in level}
+
+        index = self._get_dest_folder_index()
+        if index is not None:
+            existing = {folder.id: {'files': [{'id': index[(folder.name, parent_ids[folder.id])]}]}
+                        for folder in level if (folder.name, parent_ids[folder.id]) in index}
+        else:
+            checks = [
+                (folder.id, self.dest_service.files().list(
+                    q=self._folder_exists_query(folder.name, parent_ids[folder.id]),
+                    fields="files(id, name)", pageSize=1000,
+                    supportsAllDrives=True, includeItemsFromAllDrives=True
+                ))
+                for folder in level
+            ]
+            existing = self._execute_batch(checks, self.dest_service, "folder check")
+
+        creates = []
+        for folder in level:
+            matches = existing.get(folder.id, {}).get('files', [])
+            if matches:
+                self.folder_mapping[folder.id] = matches[0]['id']
                 continue
-
-            # Create folder in destination
             folder_metadata = {
                 'name': folder.name,
                 'mimeType': 'application/vnd.google-apps.folder',
-                'parents': [parent_id]
+                'parents': [parent_ids[folder.id]]
             }
+            creates.append((folder.id, self.dest_service.files().create(
+                body=folder_metadata, fields='id', supportsAllDrives=True
+            )))
 
-            try:
-                created_folder = self.dest_service.files().create(
-                    body=folder_metadata, fields='id', supportsAllDrives=True
-                ).execute()
+        for source_id, created_folder in self._execute_batch(creates, self.dest_service, "folder create").items():
+            self.folder_mapping[source_id] = created_folder['id']
+            self._record_dest_folder(folders[source_id].name, parent_ids[source_id], created_folder['id'])
 
-                if created_folder is None:
-                    raise Exception("Folder creation returned None response")
+        return sum(1 for folder in level if folder.id in self.folder_mapping)
 
-                self.folder_mapping[folder.id] = created_folder['id']
-                print(f"📁 Created folder: {folder.path}")
+    def _execute_batch(self, requests: List[Tuple[str, object]], service, operation: str) -> Dict[str, dict]:
+        """Execute metadata-only requests as Drive batch calls of up to BATCH_SIZE requests each.
 
-            except HttpError as e:
-                print(f"❌ Error creating folder {folder.path}: {e}")
-                continue
+        Requests are (key, request) pairs. Per-request results come back through the batch
+        callback; rate-limited or server failures are retried in a later batch. Returns a mapping
+        of key to response for every request that succeeded.
+        """
+        results: Dict[str, dict] = {}
+        pending = list(requests)
+
+        for attempt in range(self.config.max_retries):
+            retry = []
+
+            for start in range(0, len(pending), BATCH_SIZE):
+                chunk = dict(pending[start:start + BATCH_SIZE])
+
+                def callback(request_id, response, exception, chunk=chunk):
+                    if exception is None:
+                        results[request_id] = response
+                    elif isinstance(exception, HttpError) and exception.resp.status in [403, 429, 500, 502, 503, 504]:
+                        retry.append((request_id, chunk[request_id]))
+                    else:
+                        print(f"❌ Batched {operation} failed for {request_id}: {exception}")
+
+                batch = service.new_batch_http_request(callback=callback)
+                for key, request in chunk.items():
+                    batch.add(request, request_id=key)
+
+                # Every call inside a batch counts against the per-user quota
+                self.folder_rate_limiter.acquire(len(chunk))
+                try:
+                    batch.execute()
+                except Exception as e:
+                    if not self.is_network_error(e) and not isinstance(e, HttpError):
+                        raise
+                    print(f"⚠️  Batch {operation} request failed, will retry: {e}")
+                    queued_keys = {key for key, _ in retry}
+                    retry.extend((key, request) for key, request in chunk.items()
+                                 if key not in results and key not in queued_keys)
+
+            if not retry:
+                break
+
+            pending = retry
+            if attempt < self.config.max_retries - 1:
+                wait_time = self.config.retry_delay * (2 ** attempt)
+                print(f"⚠️  {len(retry)} batched {operation} requests will be retried in {wait_time}s...")
+                time.sleep(wait_time)
+            else:
+                print(f"❌ {len(retry)} batched {operation} requests failed after {self.config.max_retries} attempts")
+
+        return results
+
+    def _find_dest_parent_id(self, item: FileInfo) -> str:
+        """Find the destination ID of a source item's parent folder, defaulting to the destination root.
+
+        Resolved straight from the item's source parent IDs through folder_mapping in O(1). Raises
+        FolderCreationError when the parent's creation failed, instead of moving the item to the root.
+        """
+        for source_parent_id in item.parents:
+            dest_parent_id = self.folder_mapping.get(source_parent_id)
+            if not dest_parent_id and self.config.lazy_folders and source_parent_id in self.source_folders:
+                dest_parent_id = self._ensure_dest_folder(source_parent_id)
+            if dest_parent_id:
+                return dest_parent_id
+        if any(source_parent_id in self.failed_folders for source_parent_id in item.parents):
+            raise FolderCreationError(f"Destination folder for {item.path} could not be created")
+        return self.config.dest_folder_id
+
+    def _ensure_dest_folder(self, source_folder_id: str) -> Optional[str]:
+        """Create a source folder's destination copy on first use, creating missing ancestors first.
+
+        Concurrent callers for the same folder wait on one shared future, so each folder is
+        checked and created exactly once. A failed attempt is not kept: the next caller tries again.
+        """
+        dest_id = self.folder_mapping.get(source_folder_id)
+        if dest_id:
+            return dest_id
+
+        with self.folder_futures_lock:
+            future = self.folder_futures.get(source_folder_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.folder_futures[source_folder_id] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            folder = self.source_folders[source_folder_id]
+            dest_id = self._create_dest_folder(folder, self._find_dest_parent_id(folder))
+            if dest_id is None:
+                raise FolderCreationError(f"Could not create destination folder {folder.path}")
+            future.set_result(dest_id)
+            return dest_id
+        except Exception as e:
+            with self.folder_futures_lock:
+                self.folder_futures.pop(source_folder_id, None)
+            future.set_exception(e)
+            raise
+
+    def _create_dest_folder(self, folder: FileInfo, parent_id: str, dest_id: Optional[str] = None) -> Optional[str]:
+        """Create (or reuse) the destination copy of a source folder and record it in folder_mapping.
+
+        When dest_id is given (from files.generateIds) the folder is created with that ID.
+        """
+        # Check if folder already exists in destination
+        if self._get_dest_folder_index() is None:
+            self.folder_rate_limiter.acquire()
+        existing_folder_id = self._check_folder_exists(folder.name, parent_id)
+        if existing_folder_id:
+            print(f"📁 Folder already exists: {folder.path} (ID: {existing_folder_id})")
+            self.folder_mapping[folder.id] = existing_folder_id
+            return existing_folder_id
+
+        # Create folder in destination
+        folder_metadata = {
+            'name': folder.name,
+            'mimeType': 'application/vnd.google-apps.folder',
+            'parents': [parent_id]
+        }
+        if dest_id:
+            folder_metadata['id'] = dest_id
+
+        try:
+            self.folder_rate_limiter.acquire()
+            # Folders are created from worker, pipeline and lane threads, each on its own connection
+            created_folder = self.dest_service.files().create(
+                body=folder_metadata, fields='id', supportsAllDrives=True
+            ).execute(http=self._thread_http(self.dest_service))
+
+            if created_folder is None:
+                raise Exception("Folder creation returned None response")
+
+            self.folder_mapping[folder.id] = created_folder['id']
+            self._record_dest_folder(folder.name, parent_id, created_folder['id'])
+            print(f"📁 Created folder: {folder.path}")
+            return created_folder['id']
+
+        except HttpError as e:
+            if dest_id and e.resp.status == 409:
+                # An earlier attempt already created the folder with this ID
+                self.folder_mapping[folder.id] = dest_id
+                self._record_dest_folder(folder.name, parent_id, dest_id)
+                return dest_id
+            print(f"❌ Error creating folder {folder.path}: {e}")
+            return None
 
-            time.sleep(self.config.rate_limit_delay)
+    def _create_folders_with_generated_ids(self, folders: Dict[str, FileInfo]) -> None:
+        """Pre-assign destination IDs with files.generateIds, then create every folder in parallel.
+
+        folder_mapping is complete before the first create is issued. Drive still rejects a create
+        whose parent does not exist yet, so each create waits only for its own parent rather than
+        for a whole depth level.
+        """
+        pending = sorted((f for f in folders.values() if f.id not in self.folder_mapping),
+                         key=lambda f: f.path.count('/'))
+        if not pending:
+            return
+
+        print(f"   🆔 Generating {len(pending)} destination folder IDs...")
+        for folder, dest_id in zip(pending, self._generate_dest_ids(len(pending))):
+            self.folder_mapping[folder.id] = dest_id
+        parent_ready = {folder.id: threading.Event() for folder in pending}
+
+        start_time = time.time()
+        # Parents are submitted before their children, so a waiting task's parent is always running
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = [
+                executor.submit(self._create_folder_with_generated_id, folder, parent_ready)
+                for folder in pending
+            ]
+            wait(futures)
+
+        created = sum(1 for f in futures if f.exception() is None and f.result())
+        elapsed = max(time.time() - start_time, 1e-6)
+        print(f"   ✅ {created}/{len(pending)} folders ready in {elapsed:.1f}s ({len(pending) / elapsed:.1f} folders/sec)")
+
+    def _create_folder_with_generated_id(self, folder: FileInfo, parent_ready: Dict[str, threading.Event]) -> Optional[str]:
+        """Create one folder under its pre-assigned ID once its parent folder exists.
+
+        If the parent failed, this folder fails too, so the subtree is not recreated under the root.
+        """
+        dest_id = None
+        try:
+            source_parent_id = folder.parents[0] if folder.parents else None
+            if source_parent_id in parent_ready:
+                parent_ready[source_parent_id].wait()
+                if source_parent_id in self.failed_folders:
+                    print(f"❌ Skipping folder {folder.path}: its parent folder could not be created")
+                    return None
+
+            parent_id = self._find_dest_parent_id(folder)
+            dest_id = self._create_dest_folder(folder, parent_id, dest_id=self.folder_mapping[folder.id])
+            return dest_id
+        finally:
+            if dest_id is None:
+                # Never leave children or files pointing at an ID that was not created
+                self.folder_mapping.pop(folder.id, None)
+                self.failed_folders.add(folder.id)
+            parent_ready[folder.id].set()
+
+    def _generate_dest_ids(self, count: int) -> List[str]:
+        """Reserve count file IDs in the destination drive (files.generateIds allows 1000 per call)."""
+        ids = []
+        while len(ids) < count:
+            self.folder_rate_limiter.acquire()
+            response = self.dest_service.files().generateIds(
+                count=min(1000, count - len(ids)), space='drive', type='files'
+            ).execute()
+            ids.extend(response['ids'])
+        return ids
+
+    def start_destination_snapshot(self) -> Future:
+        """Start listing the destination folder tree in the background.
+
+        Once it completes, folder existence checks are answered from an in-memory
+        (name, parent_id) -> folder_id index instead of one files.list call per folder.
+        """
+        future = Future()
+
+        def run_snapshot():
+            try:
+                future.set_result(self._snapshot_destination())
+            except Exception as e:
+                future.set_exception(e)
+
+        self.dest_snapshot_future = future
+        threading.Thread(target=run_snapshot, name='dest-snapshot', daemon=True).start()
+        return future
+
+    def _snapshot_destination(self) -> Dict[Tuple[str, str], str]:
+        """List every folder below the destination root and index it by (name, parent_id)."""
+        print("🗂️  Snapshotting destination folder tree...")
+        index: Dict[Tuple[str, str], str] = {}
+        # Folder-only listings are small, so always pack many parents into each request
+        for parent_id, folders in self._crawl_folder_tree(self.config.dest_folder_id, self.dest_service,
+                                                         folders_only=True,
+                                                         parents_per_query=self.config.scan_parents_per_query):
+            for folder in folders:
+                index.setdefault((folder['name'], parent_id), folder['id'])
+        print(f"   ✅ Destination snapshot ready: {len(index)} existing folders")
+        return index
+
+    def _get_dest_folder_index(self) -> Optional[Dict[Tuple[str, str], str]]:
+        """Return the destination snapshot index, waiting for it if needed; None if unavailable."""
+        if self.dest_snapshot_future is None:
+            return None
+        try:
+            return self.dest_snapshot_future.result()
+        except Exception as e:
+            print(f"⚠️  Destination snapshot failed, checking folders one by one: {e}")
+            self.dest_snapshot_future = None
+            return None
+
+    def _record_dest_folder(self, folder_name: str, parent_id: str, folder_id: str):
+        """Add a newly created destination folder to the snapshot index, if there is one."""
+        index = self._get_dest_folder_index()
+        if index is not None:
+            with self.progress_lock:
+                index.setdefault((folder_name, parent_id), folder_id)
 
     def _check_folder_exists(self, folder_name: str, parent_id: str) -> Optional[str]:
         """Check if a folder with the given name already exists in the parent folder."""
+        index = self._get_dest_folder_index()
+        if index is not None:
+            return index.get((folder_name, parent_id))
+
         try:
             results = self.dest_service.files().list(
-                q=f"name = '{folder_name}' and '{parent_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false",
+                q=self._folder_exists_query(folder_name, parent_id),
                 fields="files(id, name)",
                 pageSize=1000,  # Increased from 1 to prevent pagination issues
                 supportsAllDrives=True,
                 includeItemsFromAllDrives=True
-            ).execute()
+            ).execute(http=self._thread_http(self.dest_service))
 
             if results is None:
                 print("⚠️  Warning: Folder existence check returned None")
@@ -473,7 +1471,12 @@ class GoogleDriveTransfer:
             print(f"⚠️  Warning: Could not check if folder exists: {e}")
             return None
 
-    def transfer_file_safe(self, file_info: FileInfo, source_folders: Dict[str, FileInfo]) -> bool:
+    def _folder_exists_query(self, folder_name: str, parent_id: str) -> str:
+        """Drive query matching a non-trashed folder with this name directly inside parent_id."""
+        return (f"name = '{folder_name}' and '{parent_id}' in parents and "
+                f"mimeType = 'application/vnd.google-apps.folder' and trashed = false")
+
+    def transfer_file_safe(self, file_info: FileInfo, dest_parent_id: Optional[str] = None) -> bool:
         """Transfer a single file with retry logic and memory safety."""
         # Show when transfer starts (without newline to avoid interfering with progress)
         print(f"⏳ Starting: {file_info.name}", end='\r')
@@ -487,43 +1490,59 @@ class GoogleDriveTransfer:
             parents=file_info.parents[:],  # Copy to avoid reference issues
             path=file_info.path,
             shortcut_target_id=file_info.shortcut_target_id,
-            is_shortcut=file_info.is_shortcut
+            is_shortcut=file_info.is_shortcut,
+            md5_checksum=file_info.md5_checksum
         )
 
         for attempt in range(self.config.max_retries):
             try:
-                # Determine destination parent folder
-                parent_path = '/'.join(local_file_info.path.split('/')[:-1])
-                parent_id = self.config.dest_folder_id
-
-                if parent_path:
-                    # Find the corresponding folder in destination (use pre-scanned folders)
-                    source_folders_filtered = {fid: f for fid, f in source_folders.items()
-                                             if f.mime_type == 'application/vnd.google-apps.folder'}
-
-                    parent_folder = next(
-                        (f for f in source_folders.values() if f.path == parent_path), None
-                    )
-                    if parent_folder and parent_folder.id in self.folder_mapping:
-                        parent_id = self.folder_mapping[parent_folder.id]
+                # Determine destination parent folder (may create it on demand, so it is retried too)
+                parent_id = dest_parent_id or self._find_dest_parent_id(local_file_info)
 
                 # For shortcuts, create a shortcut in destination (no media transfer)
                 if local_file_info.mime_type == 'application/vnd.google-apps.shortcut':
                     result = self._transfer_shortcut(local_file_info, parent_id)
+                    self._count_path('shortcut', result)
                     self.adjust_concurrency(result)
                     return result
 
+                # Content already uploaded in this job is copied inside the destination instead of sent again
+                uploaded_id = self._uploaded_copy_of(local_file_info)
+                if uploaded_id and self._copy_file_server_side(local_file_info, parent_id, copy_from=uploaded_id):
+                    self._count_path('dedup copy', True)
+                    self.adjust_concurrency(True)
+                    return True
+
+                # If the destination account can read the file, copy it server-side (no bytes through us)
+                if self.config.server_side_copy and self._can_server_copy(local_file_info):
+                    if self._copy_file_server_side(local_file_info, parent_id):
+                        self._count_path('server copy', True)
+                        self.adjust_concurrency(True)
+                        return True
+
                 # For Google Docs, export as Microsoft Office format
                 if local_file_info.mime_type.startswith('application/vnd.google-apps'):
                     result = self._transfer_google_doc(local_file_info, parent_id)
+                    self._count_path('export', result)
                     self.adjust_concurrency(result)
                     return result
 
                 # For regular files, download and upload
                 result = self._transfer_regular_file(local_file_info, parent_id)
+                self._count_path('download/upload', result)
                 self.adjust_concurrency(result)
                 return result
 
+            except FolderCreationError as e:
+                # Only on-demand folders are created again; a failed pre-created folder stays failed
+                if self.config.lazy_folders and attempt < self.config.max_retries - 1:
+                    wait_time = self.config.retry_delay * (2 ** attempt)
+                    print(f"⚠️  {e}, retrying in {wait_time}s... ({local_file_info.name})")
+                    time.sleep(wait_time)
+                    continue
+                print(f"❌ Failed to transfer {local_file_info.name}: {e}")
+                self.adjust_concurrency(False)
+                return False
             except HttpError as e:
                 if e.resp.status in [403, 429, 500, 502, 503, 504]:
                     if attempt < self.config.max_retries - 1:
@@ -550,9 +1569,162 @@ class GoogleDriveTransfer:
 
         return False
 
+    def grant_temporary_access(self):
+        """Share the source root with the destination account for a server-side copy run.
+
+        The grant is recorded in the state directory before the run continues, so revoke_temporary_access
+        can remove it at the end, or at the start of the next run if this one is killed before cleaning up.
+        If it cannot be recorded, it is revoked immediately.
+        """
+        self.revoke_temporary_access()  # Leftover grant from a run that never reached its cleanup
+
+        root_id = self.config.source_folder_id
+        self.config.server_side_copy = True
+        if self._probe_dest_access(root_id) is not None:
+            print("🔓 Destination account can already read the source, no temporary share needed")
+            return
+
+        email = self.dest_service.about().get(fields='user/emailAddress').execute()['user']['emailAddress']
+        permission = self.source_service.permissions().create(
+            fileId=root_id,
+            body={'type': 'user', 'role': 'reader', 'emailAddress': email},
+            sendNotificationEmail=False,
+            supportsAllDrives=True,
+            fields='id'
+        ).execute()
+        try:
+            self._write_state_file(SHARE_GRANT_FILE, {
+                'file_id': root_id,
+                'permission_id': permission['id'],
+                'email': email,
+            })
+        except OSError as e:
+            # Without a record no later run could find the grant, so take it back right away
+            print(f"❌ Could not record temporary share in {self.config.state_dir} ({e}), revoking it")
+            self.source_service.permissions().delete(
+                fileId=root_id, permissionId=permission['id'], supportsAllDrives=True
+            ).execute()
+            raise
+        print(f"🔓 Temporarily shared source with {email} for server-side copy")
+
+    def revoke_temporary_access(self):
+        """Remove the temporary reader permission recorded by grant_temporary_access, if any."""
+        grant = self._read_state_file(SHARE_GRANT_FILE)
+        if grant is None:
+            return
+
+        try:
+            self.source_service.permissions().delete(
+                fileId=grant['file_id'], permissionId=grant['permission_id'], supportsAllDrives=True
+            ).execute()
+        except HttpError as e:
+            if e.resp.status != 404:  # 404: already revoked
+                print(f"❌ Failed to revoke temporary share for {grant['email']}: {e}")
+                print(f"   Remove it manually from source folder {grant['file_id']}")
+                return
+
+        (Path(self.config.state_dir) / SHARE_GRANT_FILE).unlink()
+        print(f"🔒 Revoked temporary share for {grant['email']}")
+
+    def _count_path(self, path: str, result: bool):
+        """Count a file completed through the given transfer path for the run summary."""
+        if result:
+            with self.progress_lock:
+                self.path_counts[path] += 1
+
+    def _can_server_copy(self, file_info: FileInfo) -> bool:
+        """Check whether the destination account can read a source file.
+
+        Access is probed once per source folder, since files inherit it from their folder; only
+        files in folders the destination cannot read are probed individually.
+        """
+        parent_id = file_info.parents[0] if file_info.parents else None
+        if parent_id:
+            with self.copy_access_lock:
+                readable = self.copy_access.get(parent_id)
+            if readable is None:
+                readable = self._probe_dest_access(parent_id) is not None
+                with self.copy_access_lock:
+                    self.copy_access[parent_id] = readable
+            if readable:
+                return True
+
+        item = self._probe_dest_access(file_info.id)
+        return item is not None and item.get('capabilities', {}).get('canCopy', False)
+
+    def _probe_dest_access(self, item_id: str) -> Optional[dict]:
+        """Fetch an item through the destination account, or None if it cannot see it."""
+        try:
+            return self.dest_service.files().get(
+                fileId=item_id, fields='id, capabilities/canCopy', supportsAllDrives=True
+            ).execute(http=self._thread_http(self.dest_service))
+        except HttpError as e:
+            if e.resp.status == 404 or (e.resp.status == 403 and 'ratelimit' not in str(e).lower()):
+                return None
+            raise
+
+    def _copy_file_server_side(self, file_info: FileInfo, parent_id: str, copy_from: Optional[str] = None) -> bool:
+        """Copy a file with files.copy in the destination account.
+
+        Copies the source file, or copy_from: a destination file already holding the same content.
+        Returns False when the copy is refused (e.g. copying restricted by the owner), so the caller
+        can fall back to a byte transfer. Google Docs stay native instead of being exported.
+        """
+        try:
+            copied = self.dest_service.files().copy(
+                fileId=copy_from or file_info.id,
+                body={'name': file_info.name, 'parents': [parent_id]},
+                fields='id',
+                supportsAllDrives=True
+            ).execute(http=self._thread_http(self.dest_service))
+        except HttpError as e:
+            if e.resp.status == 404 or (e.resp.status == 403 and 'ratelimit' not in str(e).lower()):
+                print(f"⚠️  Server-side copy refused, falling back to transfer: {file_info.name}")
+                return False
+            raise
+
+        if copied is None:
+            raise Exception("Server-side copy returned None response")
+
+        self._remember_content(file_info, copied['id'])
+        print(f"⚡ Copied server-side: {file_info.name}")
+        return True
+
+    def _content_key(self, file_info: FileInfo) -> Optional[Tuple[str, int]]:
+        """Identity of a file's bytes for deduplication; None when Drive reported no md5Checksum."""
+        if not self.config.deduplicate_content or not file_info.md5_checksum:
+            return None
+        return file_info.md5_checksum, file_info.size
+
+    def _remember_content(self, file_info: FileInfo, dest_id: str):
+        """Record that dest_id holds file_info's content, so later duplicates can be copied from it."""
+        key = self._content_key(file_info)
+        if key is not None:
+            self.content_dest_ids.setdefault(key, dest_id)
+
+    def _uploaded_copy_of(self, file_info: FileInfo) -> Optional[str]:
+        """Destination file already holding file_info's content, if one was created in this job."""
+        key = self._content_key(file_info)
+        return self.content_dest_ids.get(key) if key is not None else None
+
+    def _split_duplicates(self, file_list: List[FileInfo]) -> Tuple[List[FileInfo], List[FileInfo]]:
+        """Split files into the first of each content and the later duplicates of it."""
+        seen = set()
+        unique, duplicates = [], []
+        for file_info in file_list:
+            key = self._content_key(file_info)
+            if key is not None and key in seen:
+                duplicates.append(file_info)
+                continue
+            if key is not None:
+                seen.add(key)
+            unique.append(file_info)
+        return unique, duplicates
+
     def _transfer_google_doc(self, file_info: FileInfo, parent_id: str) -> bool:
         """Transfer Google Docs files by exporting to Microsoft Office format."""
         for attempt in range(self.config.max_retries):
+            download_buffer = None
             try:
                 export_formats = {
                     'application/vnd.google-apps.document': ('application/vnd.openxmlformats-officedocument.wordprocessingml.document', '.docx'),
@@ -577,8 +1749,14 @@ class GoogleDriveTransfer:
                     'parents': [parent_id]
                 }
 
-                # Create FRESH buffer for each attempt to prevent closed file errors
-                download_buffer = io.BytesIO()
+                if self.config.streaming_transfers and self.config.enable_resumable and attempt == 0:
+                    # Export size is unknown up front, so the upload ends on the first short read
+                    self._stream_transfer(file_info, request, file_metadata, export_mime, None)
+                    print(f"📄 Transferred Google Doc: {file_info.name}")
+                    return True
+
+                # Create FRESH spool for each attempt to prevent closed file errors
+                download_buffer = self._open_spool(None)
                 downloader = MediaIoBaseDownload(download_buffer, request)
                 done = False
                 download_start_time = time.time()
@@ -586,8 +1764,6 @@ class GoogleDriveTransfer:
                 while not done:
                     try:
                         status, done = downloader.next_chunk()
-                        if status:
-                            download_buffer.write(status)
 
                         # Check for download timeout
                         if time.time() - download_start_time > self.config.network_timeout:
@@ -651,6 +1827,9 @@ class GoogleDriveTransfer:
                 else:
                     print(f"❌ Error transferring Google Doc {file_info.name}: {e}")
                     return False
+            finally:
+                if download_buffer is not None:
+                    download_buffer.close()
 
         return False
 
@@ -667,104 +1846,515 @@ class GoogleDriveTransfer:
                 # Download file from source with timeout
                 request = self.source_service.files().get_media(fileId=file_info.id, supportsAllDrives=True)
 
-                # Create FRESH BytesIO buffer for each attempt to prevent closed file errors
-                download_buffer = io.BytesIO()
-                downloader = MediaIoBaseDownload(download_buffer, request)
-                done = False
-                download_start_time = time.time()
+                # Resumable sessions are saved under this key so a restarted run continues the upload
+                session_key = f"{file_info.id}:{parent_id}" if self.config.enable_resumable else None
 
-                while not done:
-                    try:
-                        status, done = downloader.next_chunk()
-                        if status:
-                            progress = int(status.progress() * 100)
-                            size_mb = file_info.size / (1024 * 1024) if file_info.size else 0
-                            downloaded_mb = (status.progress() * file_info.size) / (1024 * 1024) if file_info.size else 0
-                            print(f"⬇️  {file_info.name}: {progress}% ({downloaded_mb:.1f}/{size_mb:.1f} MB)", end='\r')
+                # Small files: one download request and one multipart upload, no resumable session
+                if file_info.size < self.config.small_file_threshold:
+                    response = self._transfer_small_file(file_info, file_metadata)
 
-                        # Check for download timeout
-                        if time.time() - download_start_time > self.config.network_timeout:
-                            raise TimeoutError(f"Download timeout after {self.config.network_timeout}s")
+                # Large files are fetched over several connections at once
+                elif (self.config.download_connections > 1 and file_info.size
+                        and file_info.size >= self.config.parallel_download_threshold):
+                    response = self._ranged_transfer(file_info, file_metadata, session_key)
 
-                    except Exception as e:
-                        # Clean up the downloader
-                        del downloader
-                        if self.is_network_error(e) and attempt < self.config.max_retries - 1:
-                            self.handle_network_error(e, "download", file_info.name, attempt, force_reinitialize=True)
-                            break  # Retry the whole operation
-                        else:
-                            raise e
+                # Retries fall back to a spool, whose upload can resume from local data
+                elif self.config.streaming_transfers and self.config.enable_resumable and attempt == 0:
+                    response = self._stream_transfer(file_info, request, file_metadata, file_info.mime_type,
+                                                     file_info.size, session_key)
 
-                # Clean up downloader
-                del downloader
+                else:
+                    response = self._buffered_transfer(file_info, file_metadata, session_key)
 
-                if not done:  # Download was interrupted, retry whole operation
+                self._remember_content(file_info, response['id'])
+                print(f"✅ Transferred: {file_info.name}")
+                return True
+
+            except ChecksumMismatchError as e:
+                if attempt < self.config.max_retries - 1:
+                    print(f"⚠️  {e}, retrying... ({file_info.name})")
+                    continue
+                print(f"❌ Error transferring file {file_info.name}: {e}")
+                return False
+            except Exception as e:
+                if self.is_network_error(e) and attempt < self.config.max_retries - 1:
+                    self.handle_network_error(e, "transfer", file_info.name, attempt)
                     continue
+                else:
+                    print(f"❌ Error transferring file {file_info.name}: {e}")
+                    return False
 
-                # Use the successfully downloaded content
-                download_buffer.seek(0)
-                file_content = download_buffer
+        return False
 
-                file_content.seek(0)
+    def _buffered_transfer(self, file_info: FileInfo, file_metadata: dict, session_key: Optional[str] = None) -> dict:
+        """Download a file into a pooled buffer (an mmapped spool when large), then upload from it.
 
-                # Upload to destination with timeout using direct MediaIoBaseUpload
-                upload_start_time = time.time()
+        Data is copied once, on download; the upload sends memoryview slices of the buffer.
+        """
+        with self._transfer_buffer(file_info.size) as download_buffer:
+            upload_sizer = self._new_chunk_sizer()
+            media = BufferMediaUpload(download_buffer, file_info.mime_type, upload_sizer, self.config.enable_resumable)
+            try:
+                if not media.resumable():
+                    # One upload request, built once the buffer holds the whole file
+                    local_md5 = self._download_into(file_info, download_buffer)
+                    response = self._create_upload(file_metadata, media).execute()
+                    self._verify_upload(file_info, response, local_md5)
+                    return response
+
+                uploader = self._create_upload(file_metadata, media)
+                response = self._resume_upload_session(uploader, session_key, file_info.name)
+                local_md5 = None
+                if response is None:
+                    local_md5 = self._download_into(file_info, download_buffer, uploader.resumable_progress)
+                    response = self._upload_resumable(file_info, uploader, file_info.size, "⬆️ ", "uploaded",
+                                                      session_key, upload_sizer)
+                self._verify_upload(file_info, response, local_md5)
+                return response
+            finally:
+                media.release()
+
+    @contextlib.contextmanager
+    def _transfer_buffer(self, size: int):
+        """Writable memoryview of size bytes: a pooled buffer up to spool_threshold, an mmapped temp file beyond."""
+        if size <= self.config.spool_threshold:
+            buffer = self.buffer_pool.acquire(size)
+            view = memoryview(buffer)[:size]
+            try:
+                yield view
+            finally:
+                view.release()
+                self.buffer_pool.release(buffer)
+            return
 
-                media = MediaIoBaseUpload(
-                    file_content,
-                    mimetype=file_info.mime_type,
-                    chunksize=self.config.chunk_size,
-                    resumable=self.config.enable_resumable
-                )
+        with tempfile.TemporaryFile(dir=self.config.spool_dir) as spool:
+            spool.truncate(size)
+            mm = mmap.mmap(spool.fileno(), size)
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+                try:
+                    mm.close()
+                except BufferError:
+                    pass  # A slice is still referenced; unmapped once it is collected
+
+    def _download_into(self, file_info: FileInfo, buffer, start: int = 0) -> Optional[str]:
+        """Download a file from start onwards into buffer, chunk by chunk with Range requests.
+
+        A failed chunk is retried on its own from the last good offset instead of restarting the file.
+        Returns the MD5 of the content, hashed chunk by chunk as it arrives, when the whole file was downloaded.
+        """
+        download_start_time = time.time()
+        size_mb = file_info.size / (1024 * 1024)
+        offset = start
+        md5 = hashlib.md5() if start == 0 and self.config.verify_checksums else None
+        for content in self._iter_ranges(file_info, start, None, self._new_chunk_sizer()):
+            buffer[offset:offset + len(content)] = content
+            offset += len(content)
+            if md5 is not None:
+                md5.update(content)
+
+            progress = int(offset / file_info.size * 100)
+            print(f"⬇️  {file_info.name}: {progress}% ({offset / (1024 * 1024):.1f}/{size_mb:.1f} MB)", end='\r')
+
+            # Check for download timeout
+            if time.time() - download_start_time > self.config.network_timeout:
+                raise TimeoutError(f"Download timeout after {self.config.network_timeout}s")
+
+        return md5.hexdigest() if md5 is not None else None
+
+    def _transfer_small_file(self, file_info: FileInfo, file_metadata: dict) -> dict:
+        """Copy a small file with one download request and one multipart upload request."""
+        reserved = self.memory_budget.acquire(file_info.size)
+        try:
+            # Runs on many lane threads at once, each on its own connections
+            content = self.source_service.files().get_media(fileId=file_info.id, supportsAllDrives=True).execute(
+                http=self._thread_http(self.source_service))
+            media = MediaIoBaseUpload(io.BytesIO(content), mimetype=file_info.mime_type, resumable=False)
+            uploaded = self._create_upload(file_metadata, media).execute(http=self._thread_http(self.dest_service))
+            local_md5 = hashlib.md5(content).hexdigest() if self.config.verify_checksums else None
+        finally:
+            self.memory_budget.release(reserved)
+
+        if uploaded is None:
+            raise Exception("File upload returned None response")
+        self._verify_upload(file_info, uploaded, local_md5)
+        return uploaded
+
+    def _open_spool(self, size: Optional[int]) -> SpoolFile:
+        """Open a transfer buffer, waiting for room in the memory budget for its in-RAM part."""
+        threshold = self.config.spool_threshold
+        if size and size > threshold:
+            # Known to exceed the RAM threshold, go straight to disk without touching the budget
+            spool = SpoolFile(self.memory_budget, 0, threshold, dir=self.config.spool_dir)
+            spool.rollover()
+            return spool
+        reserved = self.memory_budget.acquire(size or threshold)
+        return SpoolFile(self.memory_budget, reserved, threshold, dir=self.config.spool_dir)
+
+    def _stream_transfer(self, file_info: FileInfo, request, file_metadata: dict, mimetype: str,
+                         size: Optional[int], session_key: Optional[str] = None) -> dict:
+        """Download and upload a file concurrently through a bounded ChunkPipe.
+
+        Peak memory is about ``stream_buffers`` chunks regardless of file size, and the upload
+        runs while the download is still in progress. Files of known size are read as byte ranges,
+        so a resumed upload only downloads what the destination does not have yet.
+        """
+        chunk_size = self.config.chunk_size
+        pipe = ChunkPipe(max(2, self.config.stream_buffers) * chunk_size)
+        # An upload chunk plus a partly consumed download chunk must fit in the pipe
+        download_sizer = self._new_chunk_sizer(maximum=chunk_size)
+        upload_sizer = self._new_chunk_sizer(maximum=pipe.max_buffered - chunk_size)
+        media = StreamingMediaUpload(pipe, mimetype, upload_sizer, size)
+        uploader = self._create_upload(file_metadata, media)
+
+        response = self._resume_upload_session(uploader, session_key, file_info.name)
+        if response is not None:
+            self._verify_upload(file_info, response, None)
+            return response
+        offset = uploader.resumable_progress
+        pipe.skip_to(offset)
+        # Exports are not hashed: Google Docs have no md5Checksum to compare against
+        md5 = hashlib.md5() if size is not None and offset == 0 and self.config.verify_checksums else None
+
+        def download():
+            try:
+                if size is None:
+                    downloader = MediaIoBaseDownload(pipe, request, chunksize=chunk_size)
+                    done = False
+                    while not done:
+                        _, done = downloader.next_chunk()
+                else:
+                    for content in self._iter_ranges(file_info, offset, self._new_source_http(), download_sizer):
+                        if md5 is not None:
+                            md5.update(content)
+                        pipe.write(content)
+                pipe.finish()
+            except BaseException as e:
+                pipe.finish(error=e)
 
-                uploader = self.dest_service.files().create(
-                    body=file_metadata, media_body=media, fields='id, name', supportsAllDrives=True
-                )
+        download_thread = threading.Thread(target=download, name=f"stream-{file_info.id}", daemon=True)
+        download_thread.start()
 
-                response = None
+        try:
+            response = self._upload_resumable(file_info, uploader, size, "🔀", "streamed", session_key, upload_sizer)
+        finally:
+            pipe.abort()
+            download_thread.join()
+
+        # The download thread hashed every chunk before the upload could send it
+        self._verify_upload(file_info, response, md5.hexdigest() if md5 is not None else None)
+        return response
+
+    def _create_upload(self, file_metadata: dict, media: MediaUpload):
+        """Build the destination create request for a media upload."""
+        return self.dest_service.files().create(
+            body=file_metadata, media_body=media, fields='id, name, md5Checksum', supportsAllDrives=True
+        )
 
-                while response is None:
-                    try:
-                        status, response = uploader.next_chunk()
-                        if status:
-                            progress = int(status.progress() * 100)
-                            size_mb = file_info.size / (1024 * 1024) if file_info.size else 0
-                            uploaded_mb = (status.progress() * file_info.size) / (1024 * 1024) if file_info.size else 0
-                            print(f"⬆️  {file_info.name}: {progress}% ({uploaded_mb:.1f}/{size_mb:.1f} MB)", end='\r')
+    def _upload_resumable(self, file_info: FileInfo, uploader, size: Optional[int], icon: str, verb: str,
+                          session_key: Optional[str] = None, sizer: Optional[ChunkSizer] = None) -> dict:
+        """Run a chunked resumable upload to the destination, printing progress.
+
+        A failed chunk is retried on its own: the session is asked for its committed range and the
+        upload continues from there. With a session_key, the session URI is saved after every chunk
+        so another run can resume it. With a sizer, each chunk's throughput tunes the next chunk's size.
+        """
+        response = None
+        start_time = time.time()
+        failures = 0
+        resync = False
+        while response is None:
+            try:
+                if resync:
+                    resync = False
+                    response = self._query_upload_session(uploader)
+                    if response is not None:
+                        break
+                chunk_start, committed = time.time(), uploader.resumable_progress
+                status, response = uploader.next_chunk()
+                if sizer is not None and uploader.resumable_uri:
+                    sizer.record(uploader.resumable_progress - committed, time.time() - chunk_start)
+            except Exception as e:
+                if sizer is not None:
+                    sizer.record_failure()
+                if not self._is_retryable_chunk_error(e) or failures >= self.config.max_retries - 1:
+                    raise
+                wait_time = self.config.retry_delay * (2 ** failures)
+                failures += 1
+                print(f"⚠️  Upload chunk failed for {file_info.name}, resuming from committed offset in {wait_time}s: {e}")
+                time.sleep(wait_time)
+                resync = uploader.resumable_uri is not None  # No session yet: just retry the initiation
+                continue
 
-                        # Check for upload timeout
-                        if time.time() - upload_start_time > self.config.network_timeout:
-                            raise TimeoutError(f"Upload timeout after {self.config.network_timeout}s")
+            failures = 0
+            if session_key and response is None and uploader.resumable_uri:
+                self._save_upload_session(session_key, uploader)
+            if status and size:
+                progress = int(status.progress() * 100)
+                print(f"{icon} {file_info.name}: {progress}% ({status.resumable_progress / (1024 * 1024):.1f}/"
+                      f"{size / (1024 * 1024):.1f} MB {verb})", end='\r')
+
+            if time.time() - start_time > self.config.network_timeout:
+                raise TimeoutError(f"Upload timeout after {self.config.network_timeout}s")
+
+        if response is None:
+            raise Exception("File upload returned None response")
+        if session_key:
+            self._clear_upload_session(session_key)
+        return response
+
+    def _resume_upload_session(self, uploader, session_key: Optional[str], name: str) -> Optional[dict]:
+        """Attach uploader to the saved session for session_key and move it to the committed offset.
+
+        Returns the uploaded file if that session had already completed; the session is then dropped,
+        so later runs upload afresh. Expired or unknown sessions are dropped and the upload starts from scratch.
+        """
+        if not session_key:
+            return None
+        with self.upload_sessions_lock:
+            session = self.upload_sessions.get(session_key)
+        if session is None:
+            return None
 
-                    except Exception as e:
-                        # Clean up objects
-                        del uploader
-                        del media
-                        if self.is_network_error(e) and attempt < self.config.max_retries - 1:
-                            self.handle_network_error(e, "upload", file_info.name, attempt)
-                            break  # Retry the whole operation
-                        else:
-                            raise e
+        if session['size'] != uploader.resumable.size() or time.time() - session['created'] > UPLOAD_SESSION_TTL:
+            self._clear_upload_session(session_key)
+            return None
 
-                # Clean up objects
-                del uploader
-                del media
+        uploader.resumable_uri = session['uri']
+        try:
+            response = self._query_upload_session(uploader)
+        except HttpError as e:
+            if e.resp.status not in [404, 410]:
+                raise
+            uploader.resumable_uri = None
+            uploader.resumable_progress = 0
+            self._clear_upload_session(session_key)
+            return None
 
-                if response is None:  # Upload was interrupted, retry whole operation
-                    continue
+        if response is None:
+            print(f"♻️  Resuming upload of {name} at {uploader.resumable_progress / (1024 * 1024):.1f} MB")
+        else:
+            self._clear_upload_session(session_key)
+        return response
+
+    def _query_upload_session(self, uploader) -> Optional[dict]:
+        """Ask Drive how much of a resumable upload it has, updating uploader.resumable_progress.
+
+        Returns the uploaded file if the upload is already complete.
+        """
+        size = uploader.resumable.size()
+        resp, content = uploader.http.request(uploader.resumable_uri, method='PUT', headers={
+            'Content-Length': '0',
+            'Content-Range': f"bytes */{size if size is not None else '*'}",
+        })
+        if resp.status in [200, 201]:
+            return uploader.postproc(resp, content)
+        if resp.status == 308:
+            # Range is "bytes=0-<last committed byte>", absent when nothing has been committed
+            uploader.resumable_progress = int(resp['range'].split('-')[1]) + 1 if 'range' in resp else 0
+            return None
+        raise HttpError(resp, content, uri=uploader.resumable_uri)
+
+    def _save_upload_session(self, session_key: str, uploader):
+        """Record a resumable upload's session URI and offset in the state directory."""
+        with self.upload_sessions_lock:
+            session = self.upload_sessions.get(session_key)
+            if session is None or session['uri'] != uploader.resumable_uri:
+                session = {'uri': uploader.resumable_uri, 'size': uploader.resumable.size(), 'created': time.time()}
+                self.upload_sessions[session_key] = session
+            session['progress'] = uploader.resumable_progress
+            self._write_state_file(UPLOAD_SESSIONS_FILE, self.upload_sessions)
+
+    def _clear_upload_session(self, session_key: str):
+        with self.upload_sessions_lock:
+            if self.upload_sessions.pop(session_key, None) is not None:
+                self._write_state_file(UPLOAD_SESSIONS_FILE, self.upload_sessions)
+
+    def _ranged_transfer(self, file_info: FileInfo, file_metadata: dict, session_key: Optional[str] = None) -> dict:
+        """Download a large file as parallel byte ranges into a transfer buffer, then upload from it.
+
+        The upload reads memoryview slices of the buffer, so file data is not copied again after download.
+        When resuming a saved upload session, only the bytes past its committed offset are downloaded.
+        """
+        size = file_info.size
+        local_md5 = None
+        with self._transfer_buffer(size) as buffer:
+            upload_sizer = self._new_chunk_sizer()
+            media = BufferMediaUpload(buffer, file_info.mime_type, upload_sizer, self.config.enable_resumable)
+            try:
+                if not media.resumable():
+                    # One upload request, built once the buffer holds the whole file
+                    self._download_ranges(file_info, buffer)
+                    response = self._create_upload(file_metadata, media).execute()
+                    self._verify_upload(file_info, response, hashlib.md5(buffer).hexdigest()
+                                        if self.config.verify_checksums else None)
+                    return response
+
+                uploader = self._create_upload(file_metadata, media)
+                response = self._resume_upload_session(uploader, session_key, file_info.name)
+                if response is not None:
+                    self._verify_upload(file_info, response, None)
+                    return response
+                start = uploader.resumable_progress
+                self._download_ranges(file_info, buffer, start=start)
+                # Ranges arrive out of order, so the MD5 is taken over the finished buffer while the upload runs
+                if start == 0 and self.config.verify_checksums:
+                    local_md5 = self._md5_in_background(buffer)
+                response = self._upload_resumable(file_info, uploader, size, "⬆️ ", "uploaded", session_key, upload_sizer)
+                self._verify_upload(file_info, response, local_md5.result() if local_md5 else None)
+                return response
+            finally:
+                if local_md5 is not None:
+                    wait([local_md5])  # The hash reads the buffer, which must stay mapped until it is done
+                media.release()
+
+    def _md5_in_background(self, buffer) -> Future:
+        """Hash buffer on a separate thread. hashlib releases the GIL on large inputs, so this overlaps other work."""
+        digest = Future()
+
+        def run():
+            try:
+                digest.set_result(hashlib.md5(buffer).hexdigest())
+            except BaseException as e:
+                digest.set_exception(e)
 
-                print(f"✅ Transferred: {file_info.name}")
-                return True
+        threading.Thread(target=run, name="md5", daemon=True).start()
+        return digest
 
+    def _verify_upload(self, file_info: FileInfo, uploaded: dict, local_md5: Optional[str]):
+        """Check the md5Checksum Drive computed for an upload against the source and the bytes we sent.
+
+        On a mismatch the bad copy is deleted and ChecksumMismatchError is raised so the file is retried.
+        Without a local MD5 (resumed uploads) the destination is compared with the source's md5Checksum only.
+        """
+        if not self.config.verify_checksums:
+            return
+        dest_md5 = uploaded.get('md5Checksum')
+        expected = {md5 for md5 in (file_info.md5_checksum, local_md5) if md5}
+        if not dest_md5 or not expected or expected == {dest_md5}:
+            return
+
+        try:
+            self.dest_service.files().delete(fileId=uploaded['id'], supportsAllDrives=True).execute(
+                http=self._thread_http(self.dest_service))
+        except HttpError as e:
+            print(f"⚠️  Could not delete mismatched upload of {file_info.name}: {e}")
+        raise ChecksumMismatchError(f"Checksum mismatch for {file_info.name}: source {file_info.md5_checksum}, "
+                                    f"transferred {local_md5}, destination {dest_md5}")
+
+    def _download_ranges(self, file_info: FileInfo, buffer, start: int = 0):
+        """Fill buffer from offset start onwards using download_connections concurrent range requests."""
+        size = file_info.size
+        chunk_size = self.config.chunk_size
+        ranges = deque((offset, min(offset + chunk_size, size) - 1) for offset in range(start, size, chunk_size))
+        errors = []
+        downloaded = start
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal downloaded
+            http = self._new_source_http()  # One connection per worker; httplib2 is not thread-safe
+            while not errors:
+                try:
+                    start, end = ranges.popleft()
+                except IndexError:
+                    return
+                try:
+                    content = self._fetch_range(file_info, start, end, http)
+                except Exception as e:
+                    errors.append(e)
+                    return
+                buffer[start:start + len(content)] = content
+
+                with lock:
+                    downloaded += len(content)
+                    progress = int(downloaded / size * 100)
+                    print(f"⬇️  {file_info.name}: {progress}% ({downloaded / (1024 * 1024):.1f}/"
+                          f"{size / (1024 * 1024):.1f} MB, {len(threads)} connections)", end='\r')
+
+        threads = [threading.Thread(target=worker, name=f"range-{file_info.id}-{i}", daemon=True)
+                   for i in range(min(self.config.download_connections, len(ranges)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _iter_ranges(self, file_info: FileInfo, start: int, http, sizer: ChunkSizer):
+        """Yield a file's content from start onwards as Range requests sized by sizer."""
+        size = file_info.size
+        while start < size:
+            chunk_start = time.time()
+            content = self._fetch_range(file_info, start, min(start + sizer.chunk_size, size) - 1, http, sizer)
+            sizer.record(len(content), time.time() - chunk_start)
+            start += len(content)
+            yield content
+
+    def _fetch_range(self, file_info: FileInfo, start: int, end: int, http,
+                     sizer: Optional[ChunkSizer] = None) -> bytes:
+        """Download bytes start..end (inclusive) of a file, retrying transient failures of just this range.
+
+        With a sizer, a failure shrinks the chunk and the retry fetches only the smaller range, so
+        fewer bytes than requested may be returned.
+        """
+        for attempt in range(self.config.max_retries):
+            request = self.source_service.files().get_media(fileId=file_info.id, supportsAllDrives=True)
+            request.headers['Range'] = f"bytes={start}-{end}"
+            try:
+                content = request.execute(http=http)
             except Exception as e:
-                if self.is_network_error(e) and attempt < self.config.max_retries - 1:
-                    self.handle_network_error(e, "transfer", file_info.name, attempt)
+                if self._is_retryable_chunk_error(e) and attempt < self.config.max_retries - 1:
+                    wait_time = self.config.retry_delay * (2 ** attempt)
+                    print(f"⚠️  Download chunk failed for {file_info.name} at byte {start}, retrying in {wait_time}s: {e}")
+                    time.sleep(wait_time)
+                    if sizer is not None:
+                        sizer.record_failure()
+                        end = min(end, start + sizer.chunk_size - 1)
                     continue
-                else:
-                    print(f"❌ Error transferring file {file_info.name}: {e}")
-                    return False
-
-        return False
+                raise
+
+            if len(content) != end - start + 1:
+                raise IOError(f"Range {start}-{end} of {file_info.name} returned {len(content)} bytes")
+            return content
+
+    def _new_chunk_sizer(self, maximum: Optional[int] = None) -> ChunkSizer:
+        """Chunk sizing for one transfer direction: adaptive, or fixed at chunk_size."""
+        if not self.config.adaptive_chunk_size:
+            size = min(self.config.chunk_size, maximum or self.config.chunk_size)
+            return ChunkSizer(size, size)
+        return ChunkSizer(self.config.min_chunk_size, min(self.config.max_chunk_size, maximum or self.config.max_chunk_size))
+
+    def _is_retryable_chunk_error(self, error) -> bool:
+        """Rate limits, server errors and network failures are worth retrying a single chunk for."""
+        if isinstance(error, HttpError):
+            return error.resp.status in [403, 429, 500, 502, 503, 504]
+        return self.is_network_error(error)
+
+    def _new_source_http(self):
+        """A separate authorized connection to the source account, or None to share the service's."""
+        creds = self.credentials.get('source')
+        return AuthorizedHttp(creds, http=build_http()) if creds else None
+
+    def _thread_http(self, service):
+        """The calling thread's own authorized connection to service's account, or None to share the service's.
+
+        httplib2 is not thread-safe, so pool threads pass this to execute(http=...) instead of
+        sending concurrent requests through the service's single connection.
+        """
+        account_type = 'destination' if service is self.dest_service else 'source'
+        http = getattr(self.thread_connections, account_type, None)
+        if http is None:
+            creds = self.credentials.get(account_type)
+            if creds is None:
+                return None
+            http = AuthorizedHttp(creds, http=build_http())
+            setattr(self.thread_connections, account_type, http)
+        return http
 
     def _transfer_shortcut(self, file_info: FileInfo, parent_id: str) -> bool:
         """Transfer a Google Drive shortcut by creating it in the destination."""
@@ -778,14 +2368,7 @@ class GoogleDriveTransfer:
 
         for attempt in range(self.config.max_retries):
             try:
-                shortcut_metadata = {
-                    'name': file_info.name,
-                    'mimeType': 'application/vnd.google-apps.shortcut',
-                    'shortcutDetails': {
-                        'targetId': file_info.shortcut_target_id
-                    },
-                    'parents': [parent_id]
-                }
+                shortcut_metadata = self._shortcut_metadata(file_info, parent_id)
 
                 created_shortcut = self.dest_service.files().create(
                     body=shortcut_metadata,
@@ -822,6 +2405,51 @@ class GoogleDriveTransfer:
 
         return False
 
+    def _shortcut_metadata(self, file_info: FileInfo, parent_id: str) -> dict:
+        """Metadata recreating a source shortcut inside the given destination folder."""
+        return {
+            'name': file_info.name,
+            'mimeType': 'application/vnd.google-apps.shortcut',
+            'shortcutDetails': {
+                'targetId': file_info.shortcut_target_id
+            },
+            'parents': [parent_id]
+        }
+
+    def _transfer_shortcuts_batched(self, shortcuts: List[FileInfo]):
+        """Create all shortcuts through batch requests instead of one round trip each.
+
+        Shortcuts whose destination folder could not be created are retried one by one afterwards.
+        """
+        requests = []
+        unresolved = []
+        for file_info in shortcuts:
+            if not file_info.shortcut_target_id:
+                print(f"⚠️  Skipping shortcut with missing target: {file_info.name}")
+                continue
+            try:
+                parent_id = self._find_dest_parent_id(file_info)
+            except Exception as e:
+                print(f"⚠️  No destination folder for shortcut {file_info.name} yet, retrying it separately: {e}")
+                unresolved.append(file_info)
+                continue
+            metadata = self._shortcut_metadata(file_info, parent_id)
+            requests.append((file_info.id, self.dest_service.files().create(
+                body=metadata, supportsAllDrives=True, fields='id'
+            )))
+
+        print(f"🔗 Creating {len(requests)} shortcuts in batches of {BATCH_SIZE}...")
+        created = self._execute_batch(requests, self.dest_service, "shortcut create")
+        for file_info in shortcuts:
+            if file_info.id in created:
+                self._count_path('shortcut', True)
+                self.update_progress(increment_files=1, filename=file_info.name)
+
+        # transfer_file_safe retries the folder creation with backoff and reports shortcuts that still fail
+        for file_info in unresolved:
+            if self.transfer_file_safe(file_info):
+                self.update_progress(increment_files=1, filename=file_info.name)
+
     def update_progress(self, increment_files: int = 1, increment_bytes: int = 0, filename: str = ""):
         """Update transfer progress."""
         with self.progress_lock:
@@ -850,13 +2478,33 @@ class GoogleDriveTransfer:
             print(f"🔧 DEBUG: Limiting transfer to first {self.config.max_files} files")
             file_list = file_list[:self.config.max_files]
 
-        # Pre-scan folder structure once for all files
-        source_folders = {fid: f for fid, f in files.items()
-                         if f.mime_type == 'application/vnd.google-apps.folder'}
-
         self.total_files = len(file_list)
         self.total_bytes = sum(f.size for f in file_list if f.size)
 
+        if self.config.lazy_folders:
+            # Destination folders are created by the first file that needs them
+            self.source_folders = {fid: f for fid, f in files.items()
+                                   if f.mime_type == 'application/vnd.google-apps.folder'}
+
+        # Shortcuts are metadata-only, so batch them instead of giving each a worker round trip
+        if self.config.batch_requests and self.config.transfer_shortcuts:
+            shortcuts = [f for f in file_list if f.mime_type == 'application/vnd.google-apps.shortcut']
+            if shortcuts:
+                file_list = [f for f in file_list if f.mime_type != 'application/vnd.google-apps.shortcut']
+                self._transfer_shortcuts_batched(shortcuts)
+
+        # Repeated content is uploaded once; the duplicates run last, as copies of that upload
+        duplicates = []
+        if self.config.deduplicate_content:
+            file_list, duplicates = self._split_duplicates(file_list)
+
+        # Small regular files get their own high-concurrency lane alongside the main batches
+        small_files = []
+        if self.config.small_file_workers > 0:
+            small_files = [f for f in file_list if self._is_small_file(f)]
+            if small_files:
+                file_list = [f for f in file_list if not self._is_small_file(f)]
+
         if self.config.debug_mode:
             print(f"🔍 DEBUG: File list details:")
             for i, f in enumerate(file_list[:5]):  # Show first 5 files
@@ -867,6 +2515,10 @@ class GoogleDriveTransfer:
         self.start_time = time.time()
         print(f"🚀 Starting transfer of {self.total_files} files ({self.total_bytes / (1024**3):.2f} GB)")
         print(f"   📁 Using {self.config.max_workers} parallel workers")
+        if small_files:
+            print(f"   🪶 {len(small_files)} small files on a separate lane with {self.config.small_file_workers} workers")
+        if duplicates:
+            print(f"   🧬 {len(duplicates)} files repeat content found elsewhere and will be copied in the destination")
         print("=" * 80)
         print("⏳ Beginning file transfers... (progress will be shown for each completed file)")
         print("=" * 80)
@@ -878,6 +2530,12 @@ class GoogleDriveTransfer:
         # Use adaptive worker count
         safe_workers = self.current_workers
 
+        small_lane = None
+        if small_files:
+            small_lane = threading.Thread(target=self._transfer_small_files, args=(small_files,),
+                                          name="small-file-lane", daemon=True)
+            small_lane.start()
+
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
             # Process files in small batches to prevent memory buildup
             i = 0
@@ -892,7 +2550,7 @@ class GoogleDriveTransfer:
 
                 # Submit batch of file transfer tasks
                 future_to_file = {
-                    executor.submit(self.transfer_file_safe, file_info, source_folders): file_info
+                    executor.submit(self.transfer_file_safe, file_info): file_info
                     for file_info in batch
                 }
 
@@ -906,10 +2564,7 @@ class GoogleDriveTransfer:
                     except Exception as e:
                         print(f"❌ Error in transfer task for {file_info.name}: {e}")
 
-                # Clean up and force garbage collection after each batch
                 del future_to_file
-                import gc
-                gc.collect()
 
                 # Move to next batch
                 i += batch_size
@@ -918,6 +2573,176 @@ class GoogleDriveTransfer:
                 if i < len(file_list):
                     time.sleep(0.5)
 
+            if small_lane is not None:
+                small_lane.join()
+
+            if duplicates:
+                self._transfer_duplicates(executor, duplicates)
+
+            if self.config.lazy_folders:
+                self._create_remaining_folders(executor)
+
+        self._print_final_statistics()
+
+    def _is_small_file(self, file_info: FileInfo) -> bool:
+        return (not file_info.mime_type.startswith('application/vnd.google-apps')
+                and file_info.size < self.config.small_file_threshold)
+
+    def _transfer_small_files(self, small_files: List[FileInfo]):
+        """Transfer small files on their own lane with small_file_workers workers.
+
+        Each is two short requests and at most a few MB of memory, so they can run far wider than
+        the main lane; a semaphore keeps the number of queued tasks bounded on huge trees.
+        """
+        workers = self.config.small_file_workers
+        slots = threading.BoundedSemaphore(workers * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_info in small_files:
+                slots.acquire()
+                future = executor.submit(self.transfer_file_safe, file_info)
+                future.add_done_callback(partial(self._record_transfer, file_info))
+                future.add_done_callback(lambda _: slots.release())
+
+    def _transfer_duplicates(self, executor: ThreadPoolExecutor, duplicates: List[FileInfo]):
+        """Transfer files whose content has already been uploaded; each becomes a files.copy of that upload.
+
+        Files whose original failed to transfer fall back to a normal transfer.
+        """
+        print(f"🧬 Copying {len(duplicates)} files with already uploaded content...")
+        slots = threading.BoundedSemaphore(self.config.max_workers * 2)
+        futures = []
+        for file_info in duplicates:
+            slots.acquire()
+            future = executor.submit(self.transfer_file_safe, file_info)
+            future.add_done_callback(partial(self._record_transfer, file_info))
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+        wait(futures)
+
+    def _create_remaining_folders(self, executor: ThreadPoolExecutor):
+        """Create the on-demand folders no file needed (e.g. empty ones) so the structure is preserved."""
+        remaining = [fid for fid in self.source_folders if fid not in self.folder_mapping]
+        if not remaining:
+            return
+
+        print(f"📁 Creating {len(remaining)} folders that received no files...")
+        futures = [executor.submit(self._ensure_dest_folder, fid) for fid in remaining]
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                print(f"❌ Error creating folder: {future.exception()}")
+
+    def transfer_pipelined(self, folder_id: str) -> Dict[str, FileInfo]:
+        """Scan, create folders and transfer files concurrently instead of in separate phases.
+
+        Listings stream out of the crawler; each folder is created as soon as its parent exists and
+        each file starts transferring as soon as its parent folder has been created.
+        """
+        if self.config.scan_mode == 'drive' or self.config.incremental_scan:
+            print("⚠️  Pipelined mode always crawls folder by folder - drive/incremental scans are ignored")
+
+        structure: Dict[str, FileInfo] = {}
+        root_future = Future()
+        root_future.set_result(self.config.dest_folder_id)
+        folder_futures: Dict[str, Future] = {folder_id: root_future}
+        transfer_futures = []
+        submitted_files = 0
+        seen_content = set()
+        duplicates = []  # (file_info, parent_future) to copy once the first upload of their content is done
+
+        self.start_time = time.time()
+        print(f"🚀 Starting pipelined transfer with {self.config.max_workers} workers")
+        print("=" * 80)
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as folder_executor, \
+                ThreadPoolExecutor(max_workers=self.config.max_workers) as file_executor:
+            for parent_id, items in self._crawl_folder_tree(folder_id, self.source_service):
+                parent_folder = structure.get(parent_id)  # None for the scanned root
+                parent_future = folder_futures[parent_id]
+
+                for item in items:
+                    file_info = self._make_file_info(item, parent_folder)
+                    structure[file_info.id] = file_info
+
+                    if file_info.mime_type == 'application/vnd.google-apps.folder':
+                        folder_futures[file_info.id] = folder_executor.submit(
+                            self._create_folder_when_parent_ready, file_info, parent_future
+                        )
+                        continue
+
+                    if self.config.max_files and submitted_files >= self.config.max_files:
+                        continue
+
+                    submitted_files += 1
+                    with self.progress_lock:
+                        self.total_files += 1
+                        self.total_bytes += file_info.size
+
+                    content_key = self._content_key(file_info)
+                    if content_key is not None:
+                        if content_key in seen_content:
+                            duplicates.append((file_info, parent_future))
+                            continue
+                        seen_content.add(content_key)
+
+                    future = file_executor.submit(self._transfer_file_when_parent_ready, file_info, parent_future)
+                    future.add_done_callback(partial(self._record_transfer, file_info))
+                    transfer_futures.append(future)
+
+                    if len(transfer_futures) == 1:
+                        print(f"⏱️  First transfer queued after {time.time() - self.start_time:.1f}s")
+
+            print(f"📋 Scan complete: {len(structure)} items, {submitted_files} files queued")
+            wait(transfer_futures)
+
+            if duplicates:
+                print(f"🧬 Copying {len(duplicates)} files with already uploaded content...")
+                for file_info, parent_future in duplicates:
+                    future = file_executor.submit(self._transfer_file_when_parent_ready, file_info, parent_future)
+                    future.add_done_callback(partial(self._record_transfer, file_info))
+                    transfer_futures.append(future)
+                wait(transfer_futures)
+
+        for future in transfer_futures:
+            if future.exception() is not None:
+                print(f"❌ Error in transfer task: {future.exception()}")
+
+        self._print_final_statistics()
+        return structure
+
+    def _create_folder_when_parent_ready(self, folder: FileInfo, parent_future: Future) -> Optional[str]:
+        """Pipeline task: wait for the parent's destination folder, then create this one.
+
+        Creation is retried with backoff; if it still fails, or the parent failed, the result is None
+        and the folder's whole subtree is skipped rather than flattened into the destination root.
+        """
+        parent_id = parent_future.result()
+        if parent_id is None:
+            print(f"❌ Skipping folder {folder.path}: its parent folder could not be created")
+            return None
+
+        for attempt in range(self.config.max_retries):
+            dest_id = self._create_dest_folder(folder, parent_id)
+            if dest_id is not None:
+                return dest_id
+            if attempt < self.config.max_retries - 1:
+                time.sleep(self.config.retry_delay * (2 ** attempt))
+        return None
+
+    def _transfer_file_when_parent_ready(self, file_info: FileInfo, parent_future: Future) -> bool:
+        """Pipeline task: wait for the parent's destination folder, then transfer the file."""
+        parent_id = parent_future.result()
+        if parent_id is None:
+            print(f"❌ Skipping {file_info.path}: its destination folder could not be created")
+            return False
+        return self.transfer_file_safe(file_info, dest_parent_id=parent_id)
+
+    def _record_transfer(self, file_info: FileInfo, future: Future):
+        """Done-callback that counts a successful transfer."""
+        if future.exception() is None and future.result():
+            self.update_progress(increment_files=1, increment_bytes=file_info.size, filename=file_info.name)
+
+    def _print_final_statistics(self):
+        """Print the end-of-run transfer statistics."""
         end_time = time.time()
         duration = end_time - (self.start_time or end_time)
 
@@ -931,6 +2756,10 @@ class GoogleDriveTransfer:
         if self.transferred_bytes > 0:
             avg_speed = (self.transferred_bytes / duration) / (1024 * 1024)  # MB/s
             print(f"   • Average speed: {avg_speed:.2f} MB/s")
+        if self.path_counts:
+            print("   • Files by transfer path:")
+            for path, count in sorted(self.path_counts.items(), key=lambda item: -item[1]):
+                print(f"       - {path}: {count}")
         print("=" * 80)
 
 def run_authentication_test():
@@ -1183,6 +3012,34 @@ def main():
     transfer_parser.add_argument('--max-files', type=int, help='Limit number of files to transfer (for debugging)')
     transfer_parser.add_argument('--debug', action='store_true', help='Enable detailed debugging output')
     transfer_parser.add_argument('--skip-shortcuts', action='store_true', help='Skip transferring Google Drive shortcuts (enabled by default for latest Drive API)')
+    transfer_parser.add_argument('--scan-workers', type=int, default=8, help='Number of folders listed in parallel while scanning (default: 8)')
+    transfer_parser.add_argument('--scan-rate', type=float, default=10.0, help='Maximum listing requests per second while scanning, 0 for unlimited (default: 10)')
+    transfer_parser.add_argument('--scan-mode', choices=['folder', 'batch', 'drive'], default='folder', help='List one folder per request, OR many parents into one request, or page through the whole Shared Drive (default: folder)')
+    transfer_parser.add_argument('--incremental', action='store_true', help='Apply only Drive changes since the last completed scan to its cached structure')
+    transfer_parser.add_argument('--state-dir', default='.transfer_state', help='Directory for scan caches and other resumable state (default: .transfer_state)')
+    transfer_parser.add_argument('--pipeline', action='store_true', help='Start creating folders and transferring files while the source is still being scanned')
+    transfer_parser.add_argument('--folder-rate', type=float, default=10.0, help='Maximum folder creation requests per second, 0 for unlimited (default: 10)')
+    transfer_parser.add_argument('--pregenerate-ids', action='store_true', help='Reserve destination folder IDs up front and create all folders in parallel')
+    transfer_parser.add_argument('--batch-requests', action='store_true', help='Create folders and shortcuts through batch requests of up to 100 calls')
+    transfer_parser.add_argument('--dest-snapshot', action='store_true', help='List the destination tree once, alongside the source scan, instead of checking each folder')
+    transfer_parser.add_argument('--lazy-folders', action='store_true', help='Create destination folders on demand when the first file needs them')
+    transfer_parser.add_argument('--stream', action='store_true', help='Stream downloads straight into uploads through a bounded buffer instead of holding whole files in memory')
+    transfer_parser.add_argument('--stream-buffers', type=int, default=4, help='Chunks buffered per streaming transfer (default: 4)')
+    transfer_parser.add_argument('--spool-threshold', type=int, default=64*1024*1024, help='Buffered transfers larger than this many bytes spill to disk (default: 64MB)')
+    transfer_parser.add_argument('--spool-dir', help='Scratch directory for spilled transfers (default: system temp dir)')
+    transfer_parser.add_argument('--memory-budget', type=int, default=1024*1024*1024, help='Total bytes all workers may buffer in RAM (default: 1GB)')
+    transfer_parser.add_argument('--server-copy', action='store_true', help='Copy files server-side with files.copy when the destination account can read them')
+    transfer_parser.add_argument('--share-then-copy', action='store_true', help='Temporarily share the source with the destination account, copy everything server-side, then revoke the share')
+    transfer_parser.add_argument('--parallel-download-threshold', type=int, default=256*1024*1024, help='Download files of at least this many bytes as parallel ranges (default: 256MB)')
+    transfer_parser.add_argument('--download-connections', type=int, default=4, help='Concurrent range requests per large file, 1 to disable (default: 4)')
+    transfer_parser.add_argument('--disable-adaptive-chunks', action='store_true', help='Always use --chunk-size instead of tuning chunk size per transfer')
+    transfer_parser.add_argument('--min-chunk-size', type=int, default=1024*1024, help='Starting and smallest adaptive chunk in bytes (default: 1MB)')
+    transfer_parser.add_argument('--max-chunk-size', type=int, default=64*1024*1024, help='Largest adaptive chunk in bytes (default: 64MB)')
+    transfer_parser.add_argument('--small-file-threshold', type=int, default=5*1024*1024, help='Files below this many bytes use a single multipart upload (default: 5MB)')
+    transfer_parser.add_argument('--small-file-workers', type=int, default=32, help='Workers on the separate small-file lane, 0 to share the main workers (default: 32)')
+    transfer_parser.add_argument('--skip-verify', action='store_true', help='Do not compare uploaded files against an MD5 computed during the transfer')
+    transfer_parser.add_argument('--no-dedup', action='store_true', help='Transfer every file even when its content was already uploaded in this run')
+    transfer_parser.add_argument('--scan-parents-per-query', type=int, default=50, help='Folders listed per request in batch scan mode (default: 50)')
 
     # Network test command (standalone)
     network_parser = subparsers.add_parser('network-test', help='Run network diagnostic tests')
@@ -1226,6 +3083,34 @@ def main():
         config.max_files = getattr(args, 'max_files', None)
         config.debug_mode = getattr(args, 'debug', False)
         config.transfer_shortcuts = not getattr(args, 'skip_shortcuts', False)
+        config.scan_workers = args.scan_workers
+        config.scan_requests_per_second = args.scan_rate
+        config.scan_mode = args.scan_mode
+        config.scan_parents_per_query = args.scan_parents_per_query
+        config.incremental_scan = args.incremental
+        config.state_dir = args.state_dir
+        config.pipeline_mode = args.pipeline
+        config.folder_requests_per_second = args.folder_rate
+        config.pregenerate_folder_ids = args.pregenerate_ids
+        config.batch_requests = args.batch_requests
+        config.dest_snapshot = args.dest_snapshot
+        config.lazy_folders = args.lazy_folders
+        config.streaming_transfers = args.stream
+        config.stream_buffers = args.stream_buffers
+        config.spool_threshold = args.spool_threshold
+        config.spool_dir = args.spool_dir
+        config.memory_budget = args.memory_budget
+        config.server_side_copy = args.server_copy
+        config.share_then_copy = args.share_then_copy
+        config.parallel_download_threshold = args.parallel_download_threshold
+        config.download_connections = args.download_connections
+        config.adaptive_chunk_size = not args.disable_adaptive_chunks
+        config.min_chunk_size = args.min_chunk_size
+        config.max_chunk_size = args.max_chunk_size
+        config.small_file_threshold = args.small_file_threshold
+        config.small_file_workers = args.small_file_workers
+        config.verify_checksums = not args.skip_verify
+        config.deduplicate_content = not args.no_dedup
 
         # Create transfer instance
         transfer = GoogleDriveTransfer(config)
@@ -1243,6 +3128,28 @@ def main():
         if transfer.dest_service is None:
             raise Exception("Destination service failed to initialize")
 
+        # A grant left by a crashed run is removed whether or not this run shares again
+        transfer.revoke_temporary_access()
+        if config.share_then_copy:
+            transfer.grant_temporary_access()
+
+        if config.dest_snapshot:
+            # Runs in the background alongside the source scan
+            transfer.start_destination_snapshot()
+
+        if config.pipeline_mode:
+            print("📋 Scanning and transferring in a single pipeline...")
+            source_files = transfer.transfer_pipelined(config.source_folder_id)
+            total_files = transfer.total_files
+            total_folders = len([f for f in source_files.values() if f.mime_type == 'application/vnd.google-apps.folder'])
+
+            print(f"\n📊 Transfer Summary:")
+            print(f"   📁 Folders found: {total_folders}")
+            print(f"   📄 Files found: {total_files}")
+            print(f"   ✅ Files transferred: {transfer.transferred_files}")
+            print(f"   📈 Success rate: {(transfer.transferred_files/total_files*100):.1f}%" if total_files > 0 else "N/A")
+            return
+
         # Get source folder structure
         print("📋 Scanning source folder structure...")
         print("⏳ This may take a moment for large folders...")
@@ -1278,9 +3185,12 @@ def main():
             return
 
         # Create destination folder structure
-        print("\n🏗️ Creating destination folder structure...")
-        transfer.create_folder_structure(source_files)
-        print("✅ Folder structure created")
+        if config.lazy_folders:
+            print("\n🏗️ Destination folders will be created on demand")
+        else:
+            print("\n🏗️ Creating destination folder structure...")
+            transfer.create_folder_structure(source_files)
+            print("✅ Folder structure created")
 
         # Transfer all files with debugging
         print(f"\n🚀 Starting file transfer process...")
@@ -1311,6 +3221,9 @@ def main():
     except Exception as e:
         print(f"❌ Transfer failed: {e}")
         sys.exit(1)
+    finally:
+        if transfer.source_service is not None:
+            transfer.revoke_temporary_access()
 
 if __name__ == "__main__":
     main()
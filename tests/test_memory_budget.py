@@ -0,0 +1,38 @@
+"""Regression checks for MemoryBudget and BufferPool - no Google account needed."""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from drive_transfer import BufferPool, MemoryBudget
+
+MB = 1024 * 1024
+
+def acquire_in_thread(budget, amount, timeout=5):
+    """Run budget.acquire on a thread and return the reserved amount, or None if it blocked."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(budget.acquire(amount)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0] if result else None
+
+def test_idle_pool_buffer_is_reclaimed_by_other_budget_users():
+    budget = MemoryBudget(4 * MB)
+    pool = BufferPool(budget)
+    pool.release(pool.acquire(3 * MB))  # Rounded up to a 4 MB size class, now idle in the pool
+
+    assert budget.used == 4 * MB
+    assert acquire_in_thread(budget, 1 * MB) == 1 * MB
+    assert budget.used == 1 * MB
+    assert not any(pool.free.values())
+
+def test_pool_reuses_idle_buffer_of_same_size():
+    budget = MemoryBudget(8 * MB)
+    pool = BufferPool(budget)
+    buffer = pool.acquire(2 * MB)
+    pool.release(buffer)
+
+    assert pool.acquire(2 * MB) is buffer
+    assert budget.used == 2 * MB
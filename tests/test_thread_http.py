@@ -0,0 +1,52 @@
+"""Regression checks for per-thread connections - no Google account needed."""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+
+from drive_transfer import GoogleDriveTransfer, TransferConfig
+
+def make_transfer():
+    """Transfer engine with credentials stored the way _get_service stores them."""
+    transfer = GoogleDriveTransfer(TransferConfig(source_folder_id='root', dest_folder_id='dest'))
+    transfer.source_service, transfer.dest_service = object(), object()
+    transfer.credentials = {'source': Credentials(token='source-token'),
+                            'destination': Credentials(token='dest-token')}
+    return transfer
+
+def connections_by_thread(transfer, service, threads=3):
+    """Call _thread_http twice on each of several threads; return the (first, second) pairs."""
+    results = []
+
+    def run():
+        results.append((transfer._thread_http(service), transfer._thread_http(service)))
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+def test_dest_service_gets_per_thread_authorized_http():
+    transfer = make_transfer()
+    results = connections_by_thread(transfer, transfer.dest_service)
+
+    assert all(isinstance(first, AuthorizedHttp) for first, _ in results)
+    assert all(first is second for first, second in results)
+    assert len({id(first) for first, _ in results}) == len(results)
+    assert results[0][0].credentials.token == 'dest-token'
+
+def test_source_and_dest_connections_are_separate():
+    transfer = make_transfer()
+    source_http = transfer._thread_http(transfer.source_service)
+    dest_http = transfer._thread_http(transfer.dest_service)
+
+    assert source_http is not dest_http
+    assert source_http.credentials.token == 'source-token'
+    assert dest_http.credentials.token == 'dest-token'